@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import bump_version, get_version
+
+# user id -> (version stamp, expiry time, concrete field values)
+_users = {}
+
+
+def user_namespace(user_id):
+    return f'user:{user_id}'
+
+
+def forget_user(user_id):
+    """
+    Drop the cached user of this process and bump the shared version
+    stamp so that every other process drops it too.
+    """
+    _users.pop(str(user_id), None)
+    bump_version(user_namespace(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication keeping recently seen users in process memory.
+    An entry lives for AUTH_USER_CACHE_TTL seconds and only while the
+    version stamp of the user in the shared cache is unchanged, so the
+    permission checks of read traffic need no database query.
+    """
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+        key = str(user_id)
+        version = get_version(user_namespace(key))
+        entry = _users.get(key)
+        if entry is not None:
+            cached_version, expires, values = entry
+            if cached_version == version and expires > time.monotonic():
+                # A fresh instance per request, cached ones are never shared
+                return self.user_model.from_db(
+                    None, self.field_names(), values
+                )
+        user = super().get_user(validated_token)
+        if len(_users) >= settings.AUTH_USER_CACHE_SIZE:
+            _users.clear()
+        _users[key] = (
+            version,
+            time.monotonic() + settings.AUTH_USER_CACHE_TTL,
+            tuple(getattr(user, name) for name in self.field_names()),
+        )
+        return user
+
+    def field_names(self):
+        return [
+            field.attname for field in self.user_model._meta.concrete_fields
+        ]
@@ -0,0 +1,177 @@
+from django.db import transaction
+from rest_framework import serializers, status
+from reviews.models import Category, Genre, Title
+
+from .cache import TITLES
+from .catalog import get_catalog
+from .serializer import TitleCreateSerializer
+from .signals import invalidate
+
+GenreLink = Title.genre.through
+
+# The `id` of an item, validated like the integer fields of the serializers
+_id_field = serializers.IntegerField(min_value=1, max_value=2 ** 63 - 1)
+
+
+def _item_id(item):
+    """
+    Return (id or None, errors or None) of a bulk item. Items without an
+    `id` create a title.
+    """
+    if not isinstance(item, dict) or item.get('id') is None:
+        return None, None
+    try:
+        return _id_field.run_validation(item['id']), None
+    except serializers.ValidationError as error:
+        return None, {'id': error.detail}
+
+
+def _validate(items, context):
+    """
+    Validate every item with TitleCreateSerializer and return a list of
+    (title to update or None, validated data or None, errors or None).
+    Items with an `id` update that title; the titles are fetched in one
+    query and slugs are resolved through the in-memory catalog.
+    """
+    item_ids = [_item_id(item) for item in items]
+    titles = Title.objects.in_bulk({pk for pk, _ in item_ids if pk})
+    seen = set()
+    results = []
+    for item, (pk, errors) in zip(items, item_ids):
+        if errors is not None:
+            results.append((None, None, errors))
+            continue
+        if pk is not None and pk not in titles:
+            results.append((None, None, {'id': ['Title not found.']}))
+            continue
+        if pk is not None and pk in seen:
+            results.append((None, None, {'id': ['Title is updated twice.']}))
+            continue
+        seen.add(pk)
+        instance = titles.get(pk)
+        serializer = TitleCreateSerializer(
+            instance, data=item, partial=instance is not None,
+            context=context
+        )
+        if serializer.is_valid():
+            results.append((instance, serializer.validated_data, None))
+        else:
+            results.append((None, None, serializer.errors))
+    return results
+
+
+def _assign_ids(created):
+    # Backends that do not return the ids of bulk inserts (SQLite): the
+    # open write transaction holds the newest rows of the table
+    if not created or created[0].pk is not None:
+        return
+    ids = list(
+        Title.objects.order_by('-pk').values_list('pk', flat=True)
+        [:len(created)]
+    )
+    for title, pk in zip(created, reversed(ids)):
+        title.pk = pk
+
+
+def _write(validated):
+    """
+    Save the valid items in one transaction and return the saved title
+    of every item (None for invalid ones).
+    """
+    titles, created, updated, relinked = [], [], [], []
+    links = []
+    update_fields = set()
+    for instance, data, _ in validated:
+        if data is None:
+            titles.append(None)
+            continue
+        fields = {
+            name: value for name, value in data.items() if name != 'genre'
+        }
+        if instance is None:
+            instance = Title(**fields)
+            created.append(instance)
+        else:
+            for name, value in fields.items():
+                setattr(instance, name, value)
+            update_fields.update(fields)
+            updated.append(instance)
+        if 'genre' in data:
+            links.append((instance, data['genre']))
+            if instance.pk is not None:
+                relinked.append(instance.pk)
+        titles.append(instance)
+    if not created and not updated:
+        return titles
+    with transaction.atomic():
+        Title.objects.bulk_create(created)
+        _assign_ids(created)
+        if update_fields:
+            Title.objects.bulk_update(updated, sorted(update_fields))
+        if relinked:
+            GenreLink.objects.filter(title_id__in=relinked).delete()
+        GenreLink.objects.bulk_create(
+            GenreLink(title_id=title.pk, genre_id=genre.pk)
+            for title, genres in links
+            # A genre listed twice is linked once, as with genre.set()
+            for genre in dict.fromkeys(genres)
+        )
+        # Bulk writes send no signals to the cache handlers
+        invalidate(TITLES)
+    return titles
+
+
+def _representations(titles):
+    # TitleCreateSerializer output without a genre query per title
+    categories = {
+        category.pk: category.slug
+        for category in get_catalog(Category).instances
+    }
+    genres = {genre.pk: genre.slug for genre in get_catalog(Genre).instances}
+    slugs = {title.pk: [] for title in titles}
+    links = (
+        GenreLink.objects.filter(title_id__in=list(slugs))
+        .order_by('title_id', 'genre_id')
+        .values_list('title_id', 'genre_id')
+    )
+    for title_id, genre_id in links:
+        slugs[title_id].append(genres.get(genre_id))
+    return {
+        title.pk: {
+            'id': title.pk,
+            'name': title.name,
+            'year': title.year,
+            'description': title.description,
+            'genre': slugs[title.pk],
+            'category': categories.get(title.category_id),
+        }
+        for title in titles
+    }
+
+
+def bulk_write_titles(items, context):
+    """
+    Create or update a list of titles in one transaction. Invalid items
+    are skipped; the result holds the status and the data or the errors
+    of every item, in the order of `items`.
+    """
+    validated = _validate(items, context)
+    titles = _write(validated)
+    representations = _representations(
+        [title for title in titles if title is not None]
+    )
+    results = []
+    for (instance, _, errors), title in zip(validated, titles):
+        if errors is not None:
+            results.append({
+                'status': status.HTTP_400_BAD_REQUEST, 'errors': errors
+            })
+        else:
+            results.append({
+                'status': (
+                    status.HTTP_200_OK if instance is not None
+                    else status.HTTP_201_CREATED
+                ),
+                'data': representations[title.pk],
+            })
+    return results
@@ -0,0 +1,123 @@
+import threading
+import time
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Namespaces of cached responses
+CATEGORIES = 'categories'
+GENRES = 'genres'
+TITLES = 'titles'
+# Part of the version of every namespace: bumping it invalidates all
+# cached responses, ETags and authenticated users at once
+EVERYTHING = 'all'
+
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def get_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _version_key(namespace):
+    return f'version:{namespace}'
+
+
+def _modified_key(namespace):
+    return f'modified:{namespace}'
+
+
+def reviews_namespace(title_id):
+    return f'reviews:{title_id}'
+
+
+def comments_namespace(review_id):
+    return f'comments:{review_id}'
+
+
+def _fresh_version():
+    # Milliseconds never repeat a version that may still be cached
+    return int(time.time() * 1000)
+
+
+def _get_stamps(make_key, namespaces, fresh):
+    cache = get_cache()
+    keys = [make_key(namespace) for namespace in namespaces]
+    stamps = cache.get_many(keys)
+    for key in keys:
+        if key not in stamps:
+            stamp = fresh()
+            cache.add(key, stamp, timeout=settings.RESPONSE_VERSION_TIMEOUT)
+            stamps[key] = cache.get(key, stamp)
+    return [stamps[key] for key in keys]
+
+
+def get_version(namespace):
+    """
+    Return the version of the namespace, which changes with every bump
+    of the namespace or of EVERYTHING.
+    """
+    epoch, version = _get_stamps(
+        _version_key, (EVERYTHING, namespace), _fresh_version
+    )
+    return f'{epoch}.{version}'
+
+
+def bump_version(*namespaces):
+    """
+    Invalidate every cached response of the given namespaces.
+    """
+    cache = get_cache()
+    timeout = settings.RESPONSE_VERSION_TIMEOUT
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            cache.set(
+                _version_key(namespace), _fresh_version(), timeout=timeout
+            )
+        cache.set(_modified_key(namespace), time.time(), timeout=timeout)
+
+
+def get_modified(namespace):
+    """
+    Return the time of the last bump of the namespace or of EVERYTHING.
+    A namespace never bumped by this cache counts as modified now.
+    """
+    return max(_get_stamps(_modified_key, (EVERYTHING, namespace), time.time))
+
+
+def response_key(namespace, request):
+    # Cached pages hold absolute next/previous links: scheme and host are
+    # part of the key. Normalize the query so that parameter order does
+    # not matter
+    query = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+    )
+    return (
+        f'response:{namespace}:{get_version(namespace)}:'
+        f'{request.build_absolute_uri(request.path)}?{urlencode(query)}'
+    )
+
+
+def record(namespace, hit):
+    with _stats_lock:
+        counters = _stats.setdefault(namespace, {'hits': 0, 'misses': 0})
+        counters['hits' if hit else 'misses'] += 1
+
+
+def get_stats():
+    with _stats_lock:
+        return {
+            namespace: dict(counters)
+            for namespace, counters in _stats.items()
+        }
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
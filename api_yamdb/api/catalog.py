@@ -0,0 +1,69 @@
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from reviews.models import Category, Genre
+
+from .cache import CATEGORIES, GENRES, get_version
+
+# Small, rarely changing tables kept in process memory and the cache
+# namespace whose version stamp invalidates them
+CATALOG_NAMESPACES = {
+    Category: CATEGORIES,
+    Genre: GENRES,
+}
+
+_lock = threading.Lock()
+# model -> Catalog
+_catalogs = {}
+
+
+class Catalog:
+    """
+    Snapshot of a catalog table. The instances are shared between
+    requests and must be treated as read-only.
+    """
+
+    def __init__(self, version, instances):
+        self.version = version
+        self.expires = time.monotonic() + settings.CATALOG_TTL
+        self.instances = instances
+        self.by_slug = {instance.slug: instance for instance in instances}
+
+    def get(self, slug):
+        return self.by_slug.get(slug)
+
+    def is_current(self, version):
+        return self.version == version and self.expires > time.monotonic()
+
+
+def get_catalog(model, reload=False):
+    """
+    Return the current catalog of `model`. The table is read again after
+    a write bumped the version stamp of its namespace, after CATALOG_TTL
+    seconds (writes of other processes whose stamps this process does not
+    see, bulk loads) and when `reload` is set.
+    """
+    version = get_version(CATALOG_NAMESPACES[model])
+    seen = _catalogs.get(model)
+    if not reload and seen is not None and seen.is_current(version):
+        return seen
+    with _lock:
+        catalog = _catalogs.get(model)
+        # Another thread may have reloaded the table meanwhile
+        if (catalog is None or catalog is seen
+                or not catalog.is_current(version)):
+            # The version is read before the rows, so a write committed
+            # meanwhile only causes one more reload. The rows come from the
+            # primary: a lagging replica would be cached under the version
+            catalog = Catalog(version, list(
+                model.objects.using(DEFAULT_DB_ALIAS).order_by('pk')
+            ))
+            _catalogs[model] = catalog
+    return catalog
+
+
+def clear_catalogs():
+    with _lock:
+        _catalogs.clear()
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+# Backends keeping their entries in the memory of one process
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Version stamps bumped by one worker must invalidate the cached
+    responses, ETags and users of all others.
+    """
+    if settings.DEBUG:
+        return []
+    backend = settings.CACHES.get(
+        settings.RESPONSE_CACHE_ALIAS, {}
+    ).get('BACKEND')
+    if backend not in PROCESS_LOCAL_BACKENDS:
+        return []
+    return [
+        Error(
+            f'The {settings.RESPONSE_CACHE_ALIAS!r} cache ({backend}) is '
+            f'local to one process, so invalidations never reach the other '
+            f'workers.',
+            hint=(
+                'Point RESPONSE_CACHE_ALIAS at a cache shared by all '
+                'processes, e.g. Memcached or Redis.'
+            ),
+            id='api.E001',
+        )
+    ]
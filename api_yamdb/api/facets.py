@@ -0,0 +1,54 @@
+from collections import Counter
+
+from django.db.models import Count
+from reviews.models import Category, Genre, Title
+
+from .catalog import get_catalog
+
+
+def _catalog_counts(model, counts):
+    # Every catalog entry is listed, unmatched ones with a zero count
+    return [
+        {'name': instance.name, 'slug': instance.slug,
+         'count': counts.get(instance.pk, 0)}
+        for instance in get_catalog(model).instances
+    ]
+
+
+def _bucket_counts(name, counts):
+    # None (titles without a rating) goes last
+    keys = sorted(counts, key=lambda key: (key is None, key))
+    return [{name: key, 'count': counts[key]} for key in keys]
+
+
+def title_facets(queryset):
+    """
+    Count the titles of a filtered queryset per genre, category, year and
+    rating in two aggregate queries: one grouped by (category, year,
+    rating) and one over the genre links of the matching titles.
+    """
+    matching = queryset.order_by().values('pk')
+    categories, years, ratings = Counter(), Counter(), Counter()
+    groups = (
+        Title.objects.filter(pk__in=matching)
+        .order_by()
+        .values_list('category_id', 'year', 'rating')
+        .annotate(count=Count('pk'))
+    )
+    for category_id, year, rating, count in groups:
+        categories[category_id] += count
+        years[year] += count
+        ratings[rating] += count
+    genres = dict(
+        Title.genre.through.objects.filter(title_id__in=matching)
+        .order_by()
+        .values_list('genre_id')
+        .annotate(count=Count('title_id'))
+    )
+    return {
+        'count': sum(years.values()),
+        'genre': _catalog_counts(Genre, genres),
+        'category': _catalog_counts(Category, categories),
+        'year': _bucket_counts('year', years),
+        'rating': _bucket_counts('rating', ratings),
+    }
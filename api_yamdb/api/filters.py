@@ -1,6 +1,38 @@
-from django_filters import CharFilter
+from django import forms
+from django.conf import settings
+from django.db.models import Case, When
+from django_filters import CharFilter, Filter
+from django_filters.fields import BaseCSVField
 from django_filters.rest_framework import FilterSet
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
 from reviews.models import Title
+from reviews.search import search
+
+
+class IdListField(BaseCSVField, forms.IntegerField):
+    """
+    Comma separated list of ids: ?id__in=1,2,3. Empty items, non-integers
+    (1.7, 1e30) and values outside the SQLite INTEGER range are invalid.
+    """
+
+    default_error_messages = {'empty': 'Empty ids are not allowed.'}
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('min_value', -2 ** 63)
+        kwargs.setdefault('max_value', 2 ** 63 - 1)
+        super().__init__(*args, **kwargs)
+
+    def clean(self, value):
+        if value and any(item in self.empty_values for item in value):
+            raise forms.ValidationError(
+                self.error_messages['empty'], code='empty'
+            )
+        return super().clean(value)
+
+
+class IdListFilter(Filter):
+    field_class = IdListField
 
 
 class TitleFilter(FilterSet):
@@ -15,6 +47,41 @@ class TitleFilter(FilterSet):
     # Filter for genre slug
     genre = CharFilter(field_name='genre__slug')
 
+    # Multi-get by ids, the titles come in the requested order
+    id__in = IdListFilter(method='filter_id_in')
+
     class Meta:
         model = Title
         fields = ['genre', 'category', 'name', 'year']
+
+    def filter_id_in(self, queryset, name, value):
+        ids = list(dict.fromkeys(value))
+        if len(ids) > settings.TITLE_ID_IN_MAX:
+            raise ValidationError({
+                name: f'At most {settings.TITLE_ID_IN_MAX} ids are allowed.'
+            })
+        if not ids:
+            return queryset
+        position = Case(
+            *(When(pk=pk, then=index) for index, pk in enumerate(ids))
+        )
+        return queryset.filter(pk__in=ids).order_by(position)
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Ranked full-text search over the FTS5 index of the queryset model.
+    """
+
+    search_param = 'search'
+
+    def get_search_text(self, request):
+        return request.query_params.get(self.search_param, '').strip()
+
+    def filter_queryset(self, request, queryset, view):
+        text = self.get_search_text(request)
+        if not text:
+            return queryset
+        # An explicit order, like the positions of ?id__in=, wins over
+        # relevance
+        return search(queryset, text, ranked=not queryset.query.order_by)
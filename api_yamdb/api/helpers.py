@@ -1,9 +1,10 @@
 import uuid
 
 from django.conf import settings
-from django.core.mail import send_mail
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from reviews.models import User
+from reviews.outbox import enqueue_email
 
 
 def confirmation_code_to_email(username):
@@ -20,13 +21,14 @@ def confirmation_code_to_email(username):
     subject = 'YAMDb registration'
     message = f'Your confirmation code: {user.confirmation_code}'
 
-    # Send an email using the Django send_mail() function
-    send_mail(
-        subject,
-        message,
-        settings.EMAIL_ADMIN,  # Sender's email address
-        [user.email],  # Recipient's email address
-    )
-
-    # Save the updated user object with the assigned confirmation code
-    user.save()
+    with transaction.atomic():
+        # Save the updated user object with the assigned confirmation code
+        user.save(update_fields=['confirmation_code'])
+
+        # Queue the email, the send_queued_mail command delivers it
+        enqueue_email(
+            subject,
+            message,
+            settings.EMAIL_ADMIN,  # Sender's email address
+            user.email,  # Recipient's email address
+        )
@@ -0,0 +1,76 @@
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+
+_lock = threading.Lock()
+_endpoints = {}
+
+
+class EndpointMetrics:
+    """
+    Aggregated timings of one URL name.
+    Histograms hold request counts per upper bound in
+    REQUEST_METRICS_BUCKETS; the last slot counts slower requests.
+    """
+
+    __slots__ = (
+        'requests', 'queries', 'db_ms', 'total_ms', 'max_ms',
+        'total_histogram', 'db_histogram', 'query_histogram',
+    )
+
+    def __init__(self, buckets):
+        self.requests = 0
+        self.queries = 0
+        self.db_ms = 0.0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.total_histogram = [0] * (len(buckets) + 1)
+        self.db_histogram = [0] * (len(buckets) + 1)
+        self.query_histogram = [0] * (len(buckets) + 1)
+
+    def as_dict(self, buckets):
+        labels = [f'le_{bound}' for bound in buckets] + ['inf']
+        return {
+            'requests': self.requests,
+            'queries': self.queries,
+            'db_ms': round(self.db_ms, 3),
+            'total_ms': round(self.total_ms, 3),
+            'max_ms': round(self.max_ms, 3),
+            'avg_queries': round(self.queries / self.requests, 3),
+            'avg_db_ms': round(self.db_ms / self.requests, 3),
+            'avg_total_ms': round(self.total_ms / self.requests, 3),
+            'total_ms_histogram': dict(zip(labels, self.total_histogram)),
+            'db_ms_histogram': dict(zip(labels, self.db_histogram)),
+            'queries_histogram': dict(zip(labels, self.query_histogram)),
+        }
+
+
+def record(name, queries, db_ms, total_ms):
+    buckets = settings.REQUEST_METRICS_BUCKETS
+    with _lock:
+        metrics = _endpoints.get(name)
+        if metrics is None:
+            metrics = _endpoints[name] = EndpointMetrics(buckets)
+        metrics.requests += 1
+        metrics.queries += queries
+        metrics.db_ms += db_ms
+        metrics.total_ms += total_ms
+        metrics.max_ms = max(metrics.max_ms, total_ms)
+        metrics.total_histogram[bisect_left(buckets, total_ms)] += 1
+        metrics.db_histogram[bisect_left(buckets, db_ms)] += 1
+        metrics.query_histogram[bisect_left(buckets, queries)] += 1
+
+
+def get_metrics():
+    buckets = settings.REQUEST_METRICS_BUCKETS
+    with _lock:
+        return {
+            name: metrics.as_dict(buckets)
+            for name, metrics in sorted(_endpoints.items())
+        }
+
+
+def reset_metrics():
+    with _lock:
+        _endpoints.clear()
@@ -1,7 +1,20 @@
-from rest_framework import viewsets
+import hashlib
+import time
+
+from django.conf import settings
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import filters, viewsets
 from rest_framework.mixins import (CreateModelMixin,
                                    DestroyModelMixin,
                                    ListModelMixin)
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from . import cache
+from .catalog import get_catalog
+from .replicas import stop_using_replicas, use_replicas
+from .serializer import requested_fields
 
 
 class CommonCreateListDestroyViewset(
@@ -11,3 +24,220 @@ class CommonCreateListDestroyViewset(
     viewsets.GenericViewSet
 ):
     pass
+
+
+class ConditionalGetMixin:
+    """
+    ETag and Last-Modified validators of list and detail responses.
+    Both come from the version stamp of the collection in the shared cache,
+    so a request with a matching If-None-Match is answered with 304 before
+    any query or serialization runs.
+    """
+
+    def get_version_namespace(self):
+        raise NotImplementedError(
+            f'{type(self).__name__} must define get_version_namespace()'
+        )
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        namespace = self.get_version_namespace()
+        # The page, filters and format are part of the representation
+        representation = (
+            f'{cache.get_version(namespace)}:{request.get_full_path()}:'
+            f'{request.accepted_media_type}'
+        )
+        etag = quote_etag(
+            hashlib.md5(representation.encode()).hexdigest()
+        )
+        last_modified = int(cache.get_modified(namespace))
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return response
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().list, request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class NestedListMixin:
+    """
+    List action of a nested route: the parent is fetched first, so that
+    an empty page still tells a missing parent apart (404). Listed after
+    ConditionalGetMixin, a 304 answer still needs no query.
+    """
+
+    def get_parent(self):
+        raise NotImplementedError(
+            f'{type(self).__name__} must define get_parent()'
+        )
+
+    def list(self, request, *args, **kwargs):
+        self.get_parent()
+        return super().list(request, *args, **kwargs)
+
+
+class CachedListMixin:
+    """
+    Read-through cache of list responses.
+    The serialized data is stored under a key built from the path and
+    the normalized query parameters; the signals in api.signals bump the
+    namespace version when the underlying data changes.
+    """
+
+    cache_namespace = None
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        response_cache = cache.get_cache()
+        key = cache.response_key(self.cache_namespace, request)
+        data = response_cache.get(key)
+        if data is not None:
+            cache.record(self.cache_namespace, hit=True)
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+        cache.record(self.cache_namespace, hit=False)
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            response_cache.set(
+                key, response.data, settings.RESPONSE_CACHE_TIMEOUT
+            )
+        response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+
+class CachedListRetrieveMixin(CachedListMixin):
+    """
+    Read-through cache of list and retrieve responses.
+    """
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().retrieve, request, *args, **kwargs
+        )
+
+
+class SparseFieldsViewMixin:
+    """
+    Exposes the response fields selected by ?fields= / ?omit=, so that
+    get_queryset() can skip the joins and columns nobody will render.
+    """
+
+    def get_requested_fields(self):
+        return requested_fields(
+            self.request, self.get_serializer_class().Meta.fields
+        )
+
+
+class RowListMixin:
+    """
+    List action rendered by `row_serializer_class` (see api.rows) from
+    values() rows of the filtered queryset. Other actions, and every
+    action with FAST_LIST_SERIALIZERS off, use the regular serializer.
+    """
+
+    row_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if not settings.FAST_LIST_SERIALIZERS:
+            return super().list(request, *args, **kwargs)
+        rows = self.row_serializer_class(self.get_requested_fields())
+        queryset = rows.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(rows.to_representation(page))
+        return Response(rows.to_representation(queryset))
+
+
+class ReplicaReadMixin:
+    """
+    Safe requests read from the DATABASE_REPLICAS once authentication is
+    done (users are always read from the primary). A collection written
+    in the last DATABASE_REPLICA_LAG seconds is read from the primary:
+    a replica lagging behind would put stale data in the response cache
+    and under the ETag of the new version stamp.
+    """
+
+    def get_replica_namespace(self):
+        # The cache namespace of what the view reads, None if uncached
+        if hasattr(self, 'get_version_namespace'):
+            return self.get_version_namespace()
+        return getattr(self, 'cache_namespace', None)
+
+    def reads_from_replica(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return False
+        if request.method not in SAFE_METHODS:
+            return False
+        namespace = self.get_replica_namespace()
+        if namespace is None:
+            return True
+        modified = cache.get_modified(namespace)
+        return time.time() - modified >= settings.DATABASE_REPLICA_LAG
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.reads_from_replica(request):
+            self._replica_token = use_replicas()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = self.__dict__.pop('_replica_token', None)
+        if token is not None:
+            stop_using_replicas(token)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class CatalogListMixin:
+    """
+    Lists a catalog table from the in-memory registry of api.catalog.
+    `search_fields` are matched like SearchFilter does ('=' for an exact,
+    otherwise a partial case-insensitive match), then the instances are
+    paginated, so listing needs no query in steady state.
+    """
+
+    search_fields = ()
+
+    def filter_catalog(self, instances):
+        terms = filters.SearchFilter().get_search_terms(self.request)
+        for term in terms:
+            term = term.casefold()
+            instances = [
+                instance for instance in instances
+                if any(
+                    self.matches(instance, field, term)
+                    for field in self.search_fields
+                )
+            ]
+        return instances
+
+    @staticmethod
+    def matches(instance, field, term):
+        if field.startswith('='):
+            return getattr(instance, field[1:]).casefold() == term
+        return term in getattr(instance, field).casefold()
+
+    def list(self, request, *args, **kwargs):
+        instances = self.filter_catalog(
+            get_catalog(self.queryset.model).instances
+        )
+        page = self.paginate_queryset(instances)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(instances, many=True)
+        return Response(serializer.data)
@@ -0,0 +1,90 @@
+from rest_framework.pagination import (CursorPagination,
+                                       LimitOffsetPagination,
+                                       PageNumberPagination)
+
+
+class IdCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the primary key.
+    Every page is a single indexed range scan and no COUNT(*) is run,
+    so deep pages cost the same as the first one.
+    """
+
+    ordering = 'id'
+    page_size_query_param = 'limit'
+    max_page_size = 100
+
+
+class NewestIdCursorPagination(IdCursorPagination):
+    # Keyset pagination over the primary key, newest first
+    ordering = '-id'
+
+
+class OptionalCursorMixin:
+    """
+    Switches a paginator to keyset mode when the request carries
+    the `cursor` query parameter (an empty value opens the first page).
+    Cursor pages keep the `next`, `previous` and `results` keys,
+    but have no `count`.
+    """
+
+    cursor_pagination_class = IdCursorPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_paginator = None
+        cursor_param = self.cursor_pagination_class.cursor_query_param
+        if cursor_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(
+                queryset, request, view
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_html_context(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_html_context()
+        return super().get_html_context()
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+
+class OptionalCursorLimitOffsetPagination(OptionalCursorMixin,
+                                          LimitOffsetPagination):
+    # Limit/offset pagination with an opt-in cursor mode
+    pass
+
+
+class OptionalCursorPageNumberPagination(OptionalCursorMixin,
+                                         PageNumberPagination):
+    # Page number pagination with an opt-in cursor mode
+    pass
+
+
+class NewestFirstPageNumberPagination(OptionalCursorPageNumberPagination):
+    # Page number pagination of the newest first lists of reviews and
+    # comments, whose cursor pages are newest first as well
+    cursor_pagination_class = NewestIdCursorPagination
+
+
+class MultiGetLimitOffsetPagination(OptionalCursorLimitOffsetPagination):
+    """
+    Limit/offset pagination whose default page holds every id requested
+    through `ids_query_param`, so that a multi-get needs no `limit`.
+    """
+
+    ids_query_param = 'id__in'
+
+    def get_limit(self, request):
+        ids = request.query_params.get(self.ids_query_param, '')
+        requested = {pk.strip() for pk in ids.split(',') if pk.strip()}
+        if requested and self.limit_query_param not in request.query_params:
+            return len(requested)
+        return super().get_limit(request)
@@ -0,0 +1,60 @@
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+class _ReplicaReads:
+    # Replica state of one request; a write pins it to the primary
+    pinned = False
+
+
+_reads = ContextVar('replica_reads', default=None)
+
+
+def use_replicas():
+    """
+    Let the reads of the current request go to DATABASE_REPLICAS until
+    stop_using_replicas() is called with the returned token.
+    """
+    return _reads.set(_ReplicaReads())
+
+
+def stop_using_replicas(token):
+    _reads.reset(token)
+
+
+class ReplicaRouter:
+    """
+    Sends the reads of requests that called use_replicas() to a random
+    replica alias. Writes always go to the primary, and after the first
+    one the rest of the request reads from the primary as well, so it
+    sees its own writes. Replicas are copies of the primary and are never
+    migrated.
+    """
+
+    def db_for_read(self, model, **hints):
+        reads = _reads.get()
+        if reads is None:
+            return None
+        if reads.pinned or not settings.DATABASE_REPLICAS:
+            return DEFAULT_DB_ALIAS
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model, **hints):
+        reads = _reads.get()
+        if reads is not None:
+            reads.pinned = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        pool = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in pool and obj2._state.db in pool:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,130 @@
+from rest_framework import serializers
+from reviews.models import Genre
+
+from .serializer import (CommentSerializer, ReviewSearchSerializer,
+                         ReviewSerializer, TitleSerializer)
+
+# Shared field instance formatting datetimes exactly like the serializers
+_datetime = serializers.DateTimeField()
+
+
+class RowSerializer:
+    """
+    Read-only list serialization from values() rows.
+    The output matches `serializer_class` field for field, but no model
+    instances or serializer fields are created per row. `columns` maps
+    every output field to the values() lookups it is built from; a field
+    with a `get_<name>(row)` method is built by it, others are copied.
+    Fields missing from `columns` (write-only ones) are not rendered.
+    """
+
+    serializer_class = None
+    columns = {}
+
+    def __init__(self, fields):
+        self.fields = [name for name in fields if name in self.columns]
+
+    def values(self, queryset):
+        # `id` is always selected: cursor pages read their position from it
+        lookups = ['id']
+        for name in self.fields:
+            lookups.extend(self.columns[name])
+        return queryset.prefetch_related(None).values(
+            *dict.fromkeys(lookups)
+        )
+
+    def prepare(self, rows):
+        # Fetch what the rows of a page need in one query per relation
+        pass
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        self.prepare(rows)
+        getters = [
+            (name, getattr(self, f'get_{name}', None)) for name in self.fields
+        ]
+        return [
+            {
+                name: row[name] if getter is None else getter(row)
+                for name, getter in getters
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_pub_date(row):
+        return _datetime.to_representation(row['pub_date'])
+
+
+class TitleRows(RowSerializer):
+    serializer_class = TitleSerializer
+    columns = {
+        'id': ('id',),
+        'name': ('name',),
+        'year': ('year',),
+        'rating': ('rating',),
+        'review_count': ('review_count',),
+        'description': ('description',),
+        'genre': (),
+        'category': ('category_id', 'category__name', 'category__slug'),
+    }
+
+    def prepare(self, rows):
+        self.genres = {row['id']: [] for row in rows}
+        if 'genre' not in self.fields or not rows:
+            return
+        # The query prefetch_related('genre') runs, so genres come in
+        # the same order
+        links = Genre.objects.filter(
+            titles__in=list(self.genres)
+        ).values_list('titles', 'name', 'slug')
+        for title_id, name, slug in links:
+            self.genres[title_id].append({'name': name, 'slug': slug})
+
+    def get_genre(self, row):
+        return self.genres[row['id']]
+
+    @staticmethod
+    def get_category(row):
+        if row['category_id'] is None:
+            return None
+        return {'name': row['category__name'], 'slug': row['category__slug']}
+
+
+class ReviewRows(RowSerializer):
+    serializer_class = ReviewSerializer
+    columns = {
+        'id': ('id',),
+        'text': ('text',),
+        'author': ('author__username',),
+        'score': ('score',),
+        'pub_date': ('pub_date',),
+        'comment_count': ('comment_count',),
+    }
+
+    @staticmethod
+    def get_author(row):
+        return row['author__username']
+
+
+class ReviewSearchRows(ReviewRows):
+    serializer_class = ReviewSearchSerializer
+    columns = {**ReviewRows.columns, 'title': ('title_id',)}
+
+    @staticmethod
+    def get_title(row):
+        return row['title_id']
+
+
+class CommentRows(RowSerializer):
+    serializer_class = CommentSerializer
+    columns = {
+        'id': ('id',),
+        'text': ('text',),
+        'author': ('author__username',),
+        'pub_date': ('pub_date',),
+    }
+
+    @staticmethod
+    def get_author(row):
+        return row['author__username']
@@ -1,11 +1,51 @@
-from django.shortcuts import get_object_or_404
 from rest_framework import serializers
-from rest_framework.validators import UniqueTogetherValidator
+from rest_framework.permissions import SAFE_METHODS
 from reviews.models import Category, Comment, Genre, Review, Title, User
 from reviews.validators import validate_username
 
+from .catalog import get_catalog
 
-class UserSerializer(serializers.ModelSerializer):
+# Query parameters selecting the fields of read responses
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def _split_names(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+def requested_fields(request, available):
+    """
+    Return the names of `available` selected by ?fields= and ?omit=.
+    Only read requests are trimmed, writes always use every field.
+    """
+    available = list(available)
+    if request is None or request.method not in SAFE_METHODS:
+        return available
+    fields = _split_names(request.query_params.get(FIELDS_PARAM))
+    omit = _split_names(request.query_params.get(OMIT_PARAM))
+    return [
+        name for name in available
+        if (not fields or name in fields) and name not in omit
+    ]
+
+
+class SparseFieldsMixin:
+    # Drops the fields not requested by ?fields= / ?omit= from the output
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            # Nested serializers always render in full
+            return fields
+        names = requested_fields(self.context.get('request'), fields)
+        return {name: fields[name] for name in names}
+
+
+class UserSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # Serializer for User model
 
     class Meta:
@@ -59,28 +99,20 @@ class TokenSerializer(serializers.Serializer):
 
 
 class CurrentTitleDefault(object):
-    # Default value for the 'title' field based on the URL context
-
-    def set_context(self, serializer_field):
-        # Set the 'title' object based on the URL context
-        title_id = serializer_field.context.get('view').kwargs.get('title_id')
-        self.title = get_object_or_404(
-            Title,
-            id=title_id
-        )
+    # Default value for the 'title' field: the title the view resolved
+    # from the URL
+    requires_context = True
 
-    def __call__(self):
-        # Return the 'title' object as the default value
-        return self.title
+    def __call__(self, serializer_field):
+        return serializer_field.context['view'].get_title()
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # Serializer for Review model
 
     author = serializers.SlugRelatedField(
         slug_field='username',
-        queryset=User.objects.all(),
-        default=serializers.CurrentUserDefault()
+        read_only=True
     )
     title = serializers.HiddenField(
         default=CurrentTitleDefault()
@@ -88,17 +120,32 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Review
-        fields = ('id', 'text', 'author', 'score', 'pub_date', 'title')
-        validators = [
-            UniqueTogetherValidator(
-                queryset=Review.objects.all(),
-                fields=('title', 'author'),
-                message='You have already reviewed it!'
-            )
-        ]
+        fields = (
+            'id', 'text', 'author', 'score', 'pub_date', 'comment_count',
+            'title'
+        )
+        read_only_fields = ('comment_count',)
+
 
+class ReviewSearchSerializer(SparseFieldsMixin,
+                             serializers.ModelSerializer):
+    # Read-only serializer for reviews found across all titles
 
-class CommentSerializer(serializers.ModelSerializer):
+    author = serializers.SlugRelatedField(
+        slug_field='username',
+        read_only=True
+    )
+
+    class Meta:
+        model = Review
+        fields = (
+            'id', 'title', 'text', 'author', 'score', 'pub_date',
+            'comment_count'
+        )
+        read_only_fields = fields
+
+
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # Serializer for Comment model
 
     author = serializers.SlugRelatedField(
@@ -111,7 +158,7 @@ class CommentSerializer(serializers.ModelSerializer):
         fields = ('id', 'text', 'author', 'pub_date')
 
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # Serializer for Category model
 
     class Meta:
@@ -119,7 +166,7 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['name', 'slug']
 
 
-class GenreSerializer(serializers.ModelSerializer):
+class GenreSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # Serializer for Genre model
 
     class Meta:
@@ -127,13 +174,30 @@ class GenreSerializer(serializers.ModelSerializer):
         fields = ['name', 'slug']
 
 
+class CatalogSlugRelatedField(serializers.SlugRelatedField):
+    # Resolves slugs through the in-memory catalog instead of a query.
+    # An unknown slug reloads the catalog once: it may have been created
+    # by another process or a bulk load
+
+    def to_internal_value(self, data):
+        if not isinstance(data, (str, int)):
+            self.fail('invalid')
+        model = self.get_queryset().model
+        instance = get_catalog(model).get(str(data))
+        if instance is None:
+            instance = get_catalog(model, reload=True).get(str(data))
+        if instance is None:
+            self.fail('does_not_exist', slug_name=self.slug_field, value=data)
+        return instance
+
+
 class TitleCreateSerializer(serializers.ModelSerializer):
     # Serializer for creating Title model
 
-    category = serializers.SlugRelatedField(
+    category = CatalogSlugRelatedField(
         slug_field='slug', queryset=Category.objects.all(),
     )
-    genre = serializers.SlugRelatedField(
+    genre = CatalogSlugRelatedField(
         slug_field='slug', queryset=Genre.objects.all(), many=True
     )
 
@@ -144,15 +208,17 @@ class TitleCreateSerializer(serializers.ModelSerializer):
         )
 
 
-class TitleSerializer(serializers.ModelSerializer):
+class TitleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     # Serializer for Title model
 
-    rating = serializers.IntegerField()
+    rating = serializers.IntegerField(read_only=True)
     category = CategorySerializer()
     genre = GenreSerializer(many=True)
 
     class Meta:
         model = Title
         fields = (
-            'id', 'name', 'year', 'rating', 'description', 'genre', 'category'
+            'id', 'name', 'year', 'rating', 'review_count', 'description',
+            'genre', 'category'
         )
+        read_only_fields = ('review_count',)
@@ -0,0 +1,109 @@
+from django.db import transaction
+from django.db.models.signals import (m2m_changed, post_delete, post_init,
+                                      post_save)
+from django.dispatch import receiver
+from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.signals import data_rebuilt
+
+from .authentication import forget_user
+from .cache import (CATEGORIES, EVERYTHING, GENRES, TITLES, bump_version,
+                    comments_namespace, reviews_namespace)
+
+# Cached response namespaces that embed each model
+DEPENDENT_NAMESPACES = {
+    Category: (CATEGORIES, TITLES),
+    Genre: (GENRES, TITLES),
+    Title: (TITLES,),
+    Review: (TITLES,),
+}
+
+
+def invalidate(*namespaces):
+    # Readers must not cache data of a transaction that is still open
+    transaction.on_commit(lambda: bump_version(*namespaces))
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_on_write(sender, **kwargs):
+    namespaces = DEPENDENT_NAMESPACES.get(sender)
+    if namespaces:
+        invalidate(*namespaces)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_reviews(sender, instance, **kwargs):
+    # Conditional GET validators of the review and comment collections
+    invalidate(
+        reviews_namespace(instance.title_id),
+        comments_namespace(instance.pk),
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comments(sender, instance, **kwargs):
+    # The comment count shown with the review changed as well
+    if Comment.review.is_cached(instance):
+        title_id = instance.review.title_id
+    else:
+        title_id = Review.objects.filter(
+            pk=instance.review_id
+        ).values_list('title_id', flat=True).first()
+    namespaces = [comments_namespace(instance.review_id)]
+    if title_id is not None:
+        namespaces.append(reviews_namespace(title_id))
+    invalidate(*namespaces)
+
+
+@receiver(post_delete, sender=Title)
+def invalidate_title_reviews(sender, instance, **kwargs):
+    # A deleted title must not keep answering 304 for its reviews
+    invalidate(reviews_namespace(instance.pk))
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def invalidate_on_genre_change(sender, action, **kwargs):
+    if action.startswith('post_'):
+        invalidate(TITLES)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # Role changes, bans and deletions must reach the authentication cache
+    user_id = instance.pk
+    transaction.on_commit(lambda: forget_user(user_id))
+
+
+@receiver(post_init, sender=User)
+def remember_username(sender, instance, **kwargs):
+    # Read the raw attribute so that a deferred username is not loaded
+    instance._loaded_username = instance.__dict__.get('username')
+
+
+@receiver(post_save, sender=User)
+def invalidate_on_rename(sender, instance, created, **kwargs):
+    # Reviews and comments show the username of their author
+    old_username = instance._loaded_username
+    instance._loaded_username = instance.username
+    if created or old_username in (None, instance.username):
+        return
+    title_ids = Review.objects.filter(
+        author=instance
+    ).values_list('title_id', flat=True).distinct()
+    review_ids = Comment.objects.filter(
+        author=instance
+    ).values_list('review_id', flat=True).distinct()
+    namespaces = [reviews_namespace(title_id) for title_id in title_ids]
+    namespaces.extend(
+        comments_namespace(review_id) for review_id in review_ids
+    )
+    if namespaces:
+        invalidate(*namespaces)
+
+
+@receiver(data_rebuilt)
+def invalidate_everything(sender, **kwargs):
+    invalidate(EVERYTHING)
@@ -1,9 +1,9 @@
 from django.urls import include, path
 from rest_framework import routers
 from .views import (CategoryViewSet, CommentViewSet,
-                    GenreViewSet, ReviewViewSet,
-                    TitleViewSet, UserViewSet,
-                    get_confirmation_code, get_token)
+                    GenreViewSet, ReviewSearchViewSet, ReviewViewSet,
+                    TitleViewSet, UserViewSet, cache_stats, export_dataset,
+                    get_confirmation_code, get_token, request_metrics)
 
 app_name = 'api'
 
@@ -15,6 +15,9 @@ router_v1.register('users', UserViewSet)
 router_v1.register('categories', CategoryViewSet, basename='categories')
 router_v1.register('genres', GenreViewSet, basename='genres')
 router_v1.register('titles', TitleViewSet, basename='titles')
+router_v1.register(
+    'reviews/search', ReviewSearchViewSet, basename='reviews-search'
+)
 
 # Register nested routes for reviews and comments
 router_v1.register(
@@ -35,5 +38,16 @@ urlpatterns = [
 
     # Custom URL patterns for authentication
     path('auth/signup/', get_confirmation_code, name='get_code'),
-    path('auth/token/', get_token, name='get_token')
+    path('auth/token/', get_token, name='get_token'),
+
+    # Streaming exports of whole tables, e.g. export/titles.ndjson
+    path(
+        'export/<slug:dataset>.<slug:file_format>',
+        export_dataset,
+        name='export_dataset'
+    ),
+
+    # Service endpoints for administrators
+    path('cache/stats/', cache_stats, name='cache_stats'),
+    path('metrics/', request_metrics, name='request_metrics'),
 ]
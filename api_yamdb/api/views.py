@@ -1,24 +1,45 @@
-from django.db.models import Avg
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import api_view, permission_classes, action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.mixins import ListModelMixin
 from rest_framework.pagination import (PageNumberPagination,
                                        LimitOffsetPagination)
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import (SAFE_METHODS, AllowAny,
+                                        IsAuthenticated)
 from rest_framework_simplejwt.tokens import RefreshToken
-from reviews.models import Category, Genre, Review, Title, User
+from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.export import DATASETS, FORMATS, export_chunks, is_public
+from reviews.search import search
+from .bulk import bulk_write_titles
+from .facets import title_facets
 from .helpers import confirmation_code_to_email
-from .mixins import CommonCreateListDestroyViewset
+from .cache import (CATEGORIES, GENRES, TITLES, comments_namespace,
+                    get_stats, reviews_namespace)
+from .metrics import get_metrics
+from .mixins import (CachedListMixin, CachedListRetrieveMixin,
+                     CatalogListMixin, CommonCreateListDestroyViewset,
+                     ConditionalGetMixin, NestedListMixin,
+                     ReplicaReadMixin, RowListMixin,
+                     SparseFieldsViewMixin)
+from .pagination import (MultiGetLimitOffsetPagination,
+                         NewestFirstPageNumberPagination,
+                         OptionalCursorPageNumberPagination)
+from .rows import CommentRows, ReviewRows, ReviewSearchRows, TitleRows
 from .permissions import (IsAdminOrStuffPermission, IsAuthorOrModerator,
                           IsAdminOrReadOnly, IsAdminRole, ReadOnly)
 from .serializer import (UserSerializer, SignUpSerializer, TokenSerializer,
                          ReviewSerializer, CommentSerializer, GenreSerializer,
                          CategorySerializer, TitleSerializer,
-                         TitleCreateSerializer, UserWithoutRoleSerializer)
+                         TitleCreateSerializer, UserWithoutRoleSerializer,
+                         ReviewSearchSerializer)
 from rest_framework.response import Response
 
-from .filters import TitleFilter
+from .filters import FullTextSearchFilter, TitleFilter
 
 
 # UserViewSet
@@ -47,7 +68,9 @@ class UserViewSet(viewsets.ModelViewSet):
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data, status=status.HTTP_200_OK)
-        serializer = UserSerializer(request.user)
+        serializer = UserSerializer(
+            request.user, context=self.get_serializer_context()
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -86,64 +109,228 @@ def get_token(request):
     )
 
 
+@api_view(['GET'])
+@permission_classes([IsAdminRole])
+def cache_stats(request):
+    # Hit and miss counters of the response cache of this process
+    return Response(get_stats(), status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminRole])
+def request_metrics(request):
+    # Query count and latency histograms per URL name of this process
+    return Response(get_metrics(), status=status.HTTP_200_OK)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_dataset(request, dataset, file_format):
+    # Whole table streamed chunk by chunk as CSV or NDJSON
+    if not is_public(dataset) or file_format not in FORMATS:
+        raise NotFound('Unknown dataset or format.')
+    response = StreamingHttpResponse(
+        export_chunks(
+            DATASETS[dataset], file_format, settings.EXPORT_CHUNK_SIZE
+        ),
+        content_type=FORMATS[file_format],
+    )
+    response['Content-Disposition'] = (
+        f'attachment; filename="{dataset}.{file_format}"'
+    )
+    return response
+
+
 # CommentViewSet
 # This viewset handles operations related to Comment model, including CRUD operations.
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(ReplicaReadMixin, ConditionalGetMixin,
+                     NestedListMixin, SparseFieldsViewMixin, RowListMixin,
+                     viewsets.ModelViewSet):
     serializer_class = CommentSerializer
+    row_serializer_class = CommentRows
     permission_classes = (IsAuthorOrModerator,)
-    pagination_class = PageNumberPagination
+    pagination_class = NewestFirstPageNumberPagination
+
+    def get_version_namespace(self):
+        return comments_namespace(self.kwargs.get('review_id'))
+
+    def get_review(self):
+        # The parent review, fetched once per request and scoped by both
+        # URL kwargs so that a review is never reached through another title
+        if not hasattr(self, '_review'):
+            self._review = get_object_or_404(
+                Review.objects.only('id', 'title_id'),
+                id=self.kwargs.get('review_id'),
+                title_id=self.kwargs.get('title_id'),
+            )
+        return self._review
+
+    def get_parent(self):
+        return self.get_review()
 
     def get_queryset(self):
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id)
-        return review.comments.all()
+        if hasattr(self, '_review'):
+            queryset = Comment.objects.filter(review=self._review)
+        else:
+            # Detail routes check the parent with a join, not a query
+            queryset = Comment.objects.filter(
+                review_id=self.kwargs.get('review_id'),
+                review__title_id=self.kwargs.get('title_id'),
+            )
+        if 'author' in self.get_requested_fields():
+            queryset = queryset.select_related('author')
+        # Newest first, read backwards from comment_review_pub_date_idx
+        return queryset.order_by('-pub_date', '-id')
 
     def perform_create(self, serializer):
-        review_id = self.kwargs.get('review_id')
-        review = get_object_or_404(Review, id=review_id)
-        serializer.save(author=self.request.user, review=review)
+        serializer.save(author=self.request.user, review=self.get_review())
 
 
 # ReviewViewSet
 # This viewset handles operations related to Review model, including CRUD operations.
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(ReplicaReadMixin, ConditionalGetMixin,
+                    NestedListMixin, SparseFieldsViewMixin, RowListMixin,
+                    viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
+    row_serializer_class = ReviewRows
     permission_classes = (IsAuthorOrModerator,)
-    pagination_class = PageNumberPagination
+    pagination_class = NewestFirstPageNumberPagination
+
+    def get_version_namespace(self):
+        return reviews_namespace(self.kwargs.get('title_id'))
+
+    def get_title(self):
+        # The parent title, fetched once per request and shared with the
+        # serializer through CurrentTitleDefault
+        if not hasattr(self, '_title'):
+            self._title = get_object_or_404(
+                Title.objects.only('id'), id=self.kwargs.get('title_id')
+            )
+        return self._title
+
+    def get_parent(self):
+        return self.get_title()
 
     def get_queryset(self):
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        return title.reviews.all()
+        queryset = Review.objects.filter(title_id=self.kwargs.get('title_id'))
+        if 'author' in self.get_requested_fields():
+            queryset = queryset.select_related('author')
+        # Newest first, read backwards from review_title_pub_date_idx
+        return queryset.order_by('-pub_date', '-id')
 
     def perform_create(self, serializer):
-        title_id = self.kwargs.get('title_id')
-        title = get_object_or_404(Title, id=title_id)
-        serializer.save(author=self.request.user, title=title)
+        try:
+            with transaction.atomic():
+                serializer.save(
+                    author=self.request.user, title=self.get_title()
+                )
+        except IntegrityError:
+            # The review_only_once constraint, no query checks it up front
+            raise ValidationError(
+                {'non_field_errors': ['You have already reviewed it!']}
+            )
+
+
+# ReviewSearchViewSet
+# This viewset handles full-text search over the reviews of all titles.
+class ReviewSearchViewSet(ReplicaReadMixin, SparseFieldsViewMixin,
+                          RowListMixin, ListModelMixin,
+                          viewsets.GenericViewSet):
+    queryset = Review.objects.all()
+    serializer_class = ReviewSearchSerializer
+    row_serializer_class = ReviewSearchRows
+    permission_classes = (ReadOnly,)
+    filter_backends = [FullTextSearchFilter]
+    pagination_class = OptionalCursorPageNumberPagination
+
+    def list(self, request, *args, **kwargs):
+        if not FullTextSearchFilter().get_search_text(request):
+            raise ValidationError(
+                {'search': 'This query parameter is required.'}
+            )
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if 'author' in self.get_requested_fields():
+            queryset = queryset.select_related('author')
+        return queryset
 
 
 # TitleViewSet
 # This viewset handles operations related to Title model, including CRUD operations.
-class TitleViewSet(viewsets.ModelViewSet):
-    queryset = Title.objects.annotate(
-        rating=Avg('reviews__score')
-    ).all()
+class TitleViewSet(ReplicaReadMixin, ConditionalGetMixin,
+                   CachedListRetrieveMixin, SparseFieldsViewMixin,
+                   RowListMixin, viewsets.ModelViewSet):
+    queryset = Title.objects.all()
+    cache_namespace = TITLES
     serializer_class = TitleSerializer
+    row_serializer_class = TitleRows
     permission_classes = (IsAdminRole | ReadOnly,)
-    filter_backends = [DjangoFilterBackend]
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter]
     filterset_class = TitleFilter
-    pagination_class = LimitOffsetPagination
+    pagination_class = MultiGetLimitOffsetPagination
 
     def get_serializer_class(self):
         if self.request.method in ('POST', 'PATCH',):
             return TitleCreateSerializer
         return TitleSerializer
 
+    def get_version_namespace(self):
+        return TITLES
+
+    @action(methods=['POST'], detail=False, url_path='bulk')
+    def bulk(self, request):
+        # Create (items without `id`) or update titles in one transaction
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError('Expected a list of titles.')
+        if len(items) > settings.TITLE_BULK_MAX_ITEMS:
+            raise ValidationError(
+                f'At most {settings.TITLE_BULK_MAX_ITEMS} titles per request.'
+            )
+        results = bulk_write_titles(items, self.get_serializer_context())
+        return Response({'results': results}, status=status.HTTP_200_OK)
+
+    @action(methods=['GET'], detail=False, url_path='facets')
+    def facets(self, request):
+        # Counts for the browse UI, filtered like the list and cached with it
+        return self.cached_response(self.count_facets, request)
+
+    def count_facets(self, request):
+        queryset = DjangoFilterBackend().filter_queryset(
+            request, Title.objects.all(), self
+        )
+        text = FullTextSearchFilter().get_search_text(request)
+        if text:
+            # Ranking is useless for counts and breaks the facet subqueries
+            queryset = search(queryset, text, ranked=False)
+        return Response(title_facets(queryset), status=status.HTTP_200_OK)
+
+    def get_queryset(self):
+        # Join, prefetch and load only what the response will render
+        fields = self.get_requested_fields()
+        queryset = Title.objects.all()
+        if 'category' in fields:
+            queryset = queryset.select_related('category')
+        if 'genre' in fields:
+            queryset = queryset.prefetch_related('genre')
+        if self.request.method in SAFE_METHODS:
+            columns = [
+                name for name in fields
+                if name in ('name', 'year', 'rating', 'review_count',
+                            'description', 'category')
+            ]
+            queryset = queryset.only('id', *columns)
+        return queryset
+
 
 # CategoryViewSet
 # This viewset handles operations related to Category model, including CRUD operations.
-class CategoryViewSet(CommonCreateListDestroyViewset):
+class CategoryViewSet(ReplicaReadMixin, CachedListMixin, CatalogListMixin,
+                      CommonCreateListDestroyViewset):
     queryset = Category.objects.all()
+    cache_namespace = CATEGORIES
     serializer_class = CategorySerializer
     filter_backends = [filters.SearchFilter]
     permission_classes = [IsAdminOrReadOnly, ]
@@ -154,8 +341,10 @@ class CategoryViewSet(CommonCreateListDestroyViewset):
 
 # GenreViewSet
 # This viewset handles operations related to Genre model, including CRUD operations.
-class GenreViewSet(CommonCreateListDestroyViewset):
+class GenreViewSet(ReplicaReadMixin, CachedListMixin, CatalogListMixin,
+                   CommonCreateListDestroyViewset):
     queryset = Genre.objects.all()
+    cache_namespace = GENRES
     serializer_class = GenreSerializer
     search_fields = ['=name', ]
     lookup_field = 'slug'
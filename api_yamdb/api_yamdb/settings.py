@@ -31,6 +31,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -68,9 +69,85 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Seconds a connection is reused by the requests of a worker thread
+        'CONN_MAX_AGE': 60,
+    },
+}
+
+# Aliases the safe requests of the catalog, title, review and comment
+# endpoints read from, comma separated in the DATABASE_REPLICAS environment
+# variable (e.g. DATABASE_REPLICAS=replica); empty reads the default
+# database. Each alias reads db-<alias>.sqlite3, a copy of the default
+# database refreshed by `python manage.py sync_replicas`
+DATABASE_REPLICAS = [
+    alias for alias in os.environ.get('DATABASE_REPLICAS', '').split(',')
+    if alias
+]
+for alias in DATABASE_REPLICAS:
+    DATABASES[alias] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / f'db-{alias}.sqlite3',
+        'CONN_MAX_AGE': 60,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['api.replicas.ReplicaRouter']
+
+# Seconds after a write to a collection during which it is still read from
+# the primary; keep it above the replication delay
+DATABASE_REPLICA_LAG = 60
+
+# Pragmas run on every new SQLite connection (reviews.sqlite). WAL lets
+# readers go on while a review or comment is written; NORMAL synchronous
+# is durable in WAL mode except for the last commits on power loss
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    # Bytes of the file read through memory mapping
+    'mmap_size': 256 * 1024 * 1024,
+    # Negative: KiB of page cache per connection
+    'cache_size': -64 * 1024,
+    # Milliseconds a writer waits for the lock before "database is locked"
+    'busy_timeout': 5000,
+}
+
+
+# Cache
+
+# The version stamps of the response cache, the ETags and the
+# authentication cache must be seen by every process: with DEBUG off the
+# RESPONSE_CACHE_ALIAS backend has to be shared (Memcached, Redis, ...),
+# a process-local one fails the api.E001 system check
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {
+            # Entries kept before a third of them is culled
+            'MAX_ENTRIES': 100000,
+        },
     }
 }
 
+# Cache used for the catalog responses and how long they may live
+# if no write invalidates them earlier
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = 300
+# Seconds the version stamps behind cached responses and ETags live.
+# A write no signal sees (queryset.update(), raw SQL) is served stale
+# for at most this long
+RESPONSE_VERSION_TIMEOUT = 3600
+# Seconds the category and genre tables are kept in process memory
+# (api.catalog) before they are read again
+CATALOG_TTL = 60
+
+
+# Per-endpoint query count and latency metrics
+
+REQUEST_METRICS_ENABLED = True
+REQUEST_METRICS_SERVER_TIMING = True
+# Upper bounds of the histogram buckets (milliseconds or queries)
+REQUEST_METRICS_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
 
 # Password validation
 
@@ -113,7 +190,7 @@ AUTH_USER_MODEL = 'reviews.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ),
 
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
@@ -122,8 +199,38 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+
+    # orjson-backed JSON when it is installed, stdlib json otherwise; use
+    # rest_framework.renderers.JSONRenderer / parsers.JSONParser to opt out
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# Authenticated users are kept in process memory for this many seconds,
+# at most AUTH_USER_CACHE_SIZE of them
+AUTH_USER_CACHE_TTL = 60
+AUTH_USER_CACHE_SIZE = 10000
+
+# Longest id list of the ?id__in= filter of titles
+TITLE_ID_IN_MAX = 200
+
+# Largest list accepted by the bulk write action of titles
+TITLE_BULK_MAX_ITEMS = 1000
+
+# Rows fetched per query and written per chunk by the streaming exports
+EXPORT_CHUNK_SIZE = 2000
+
+# List actions render values() rows through api.rows instead of the
+# model serializers; the output is the same
+FAST_LIST_SERIALIZERS = True
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=10),
     'AUTH_HEADER_TYPES': ('Bearer',),
@@ -134,3 +241,12 @@ EMAIL_BACKEND = 'django.core.mail.backends.filebased.EmailBackend'
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, 'sent_emails')
 
 EMAIL_ADMIN = 'admin@admin.com'
+
+# Delivery of the queued emails by the send_queued_mail command:
+# emails per connection, attempts before giving up and the delay before
+# the first retry in seconds (doubled after every failure)
+EMAIL_OUTBOX_BATCH_SIZE = 100
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5
+EMAIL_OUTBOX_RETRY_DELAY = 60
+# Seconds a worker holds the emails it is sending; other workers skip them
+EMAIL_OUTBOX_LEASE = 300
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Category, Comment, Genre, Review, Title, User
+from .models import (Category, Comment, Genre, QueuedEmail, Review, Title,
+                     User)
 
 # Customize the site header
 admin.site.site_header = 'Site administration YaMDb'
@@ -85,6 +86,20 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ('author',)
 
 
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        'pk',
+        'recipient',
+        'subject',
+        'created',
+        'attempts',
+        'sent_at'
+    )
+    empty_value_display = 'no value'
+    list_filter = ('sent_at',)
+    search_fields = ('recipient',)
+
+
 # Register the custom admin models for User, Title, Category, Genre, Review, and Comment
 admin.site.register(User, UserAdmin)
 admin.site.register(Title, TitleAdmin)
@@ -92,3 +107,4 @@ admin.site.register(Category, CategoryAdmin)
 admin.site.register(Genre, GenreAdmin)
 admin.site.register(Review, ReviewAdmin)
 admin.site.register(Comment, CommentAdmin)
+admin.site.register(QueuedEmail, QueuedEmailAdmin)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ReviewsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reviews'
+
+    def ready(self):
+        # Connect the handlers keeping denormalized data up to date
+        from . import signals  # noqa: F401
+        # and the one tuning new SQLite connections
+        from . import sqlite  # noqa: F401
@@ -0,0 +1,87 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from .models import Comment, Review, Title
+from .ratings import rebuild_ratings
+
+
+def apply_comment_delta(review_id, delta):
+    """
+    Shift the stored comment count of a review by `delta`. The database
+    evaluates the expression, so concurrent writers never lose an update;
+    a count that has drifted below zero is left for reconcile_counters.
+    """
+    Review.objects.filter(
+        pk=review_id, comment_count__gte=-delta
+    ).update(comment_count=F('comment_count') + delta)
+
+
+def _actual(model, related_name, aggregate=Count('pk')):
+    related = model.objects.filter(
+        **{related_name: OuterRef('pk')}
+    ).order_by().values(related_name)
+    return Coalesce(
+        Subquery(related.annotate(total=aggregate).values('total')), 0
+    )
+
+
+def rebuild_comment_counts(queryset=None):
+    """
+    Recompute the comment counts of reviews from their comments.
+    Returns the number of updated reviews.
+    """
+    if queryset is None:
+        queryset = Review.objects.all()
+    return queryset.update(comment_count=_actual(Comment, 'review'))
+
+
+def _drifted(queryset, **actual):
+    # Primary keys of the rows whose stored fields differ from `actual`
+    drift = Q()
+    for field in actual:
+        drift |= ~Q(**{field: F(f'actual_{field}')})
+    return list(
+        queryset.annotate(**{
+            f'actual_{field}': expression
+            for field, expression in actual.items()
+        }).filter(drift).values_list('pk', flat=True)
+    )
+
+
+def _reconcile_chunk(model, start, chunk_size):
+    # Repair the rows of one primary key range in its own transaction
+    chunk = model.objects.filter(pk__gte=start, pk__lt=start + chunk_size)
+    with transaction.atomic():
+        if model is Title:
+            drifted = _drifted(
+                chunk,
+                review_count=_actual(Review, 'title'),
+                score_sum=_actual(Review, 'title', Sum('score')),
+            )
+            rebuild_ratings(Title.objects.filter(pk__in=drifted))
+        else:
+            drifted = _drifted(
+                chunk, comment_count=_actual(Comment, 'review')
+            )
+            rebuild_comment_counts(Review.objects.filter(pk__in=drifted))
+    return len(drifted)
+
+
+def reconcile_counters(chunk_size=1000, progress=None):
+    """
+    Compare the stored review and comment counts with the actual rows,
+    `chunk_size` titles or reviews at a time, and repair the drifted ones.
+    Returns the number of repaired rows per model.
+    """
+    repaired = {}
+    for model in (Title, Review):
+        repaired[model] = 0
+        last = model.objects.order_by('-pk').values_list(
+            'pk', flat=True
+        ).first() or 0
+        for start in range(1, last + 1, chunk_size):
+            repaired[model] += _reconcile_chunk(model, start, chunk_size)
+            if progress is not None:
+                progress(model, min(start + chunk_size - 1, last), last)
+    return repaired
@@ -0,0 +1,378 @@
+import csv
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+
+from django.db import connection, models, transaction
+
+from . import search
+from .importer import ImportResult, reset_sequences
+from .models import Category, Comment, Genre, Review, Title, User
+
+WORDS = (
+    'фильм', 'книга', 'музыка', 'сюжет', 'герой', 'финал', 'актёр', 'автор',
+    'история', 'режиссёр', 'песня', 'альбом', 'роман', 'глава', 'сцена',
+    'отлично', 'скучно', 'интересно', 'неожиданно', 'красиво', 'долго',
+    'смешно', 'грустно', 'сильно', 'слабо', 'рекомендую', 'пересмотрю',
+    'the', 'plot', 'great', 'boring', 'classic', 'masterpiece',
+)
+# Scores lean to the upper half of the scale, as real ratings do
+SCORE_CUM_WEIGHTS = (1, 2, 4, 7, 12, 20, 32, 47, 62, 72)
+SCORES = tuple(range(1, 11))
+DATES_START = datetime(2015, 1, 1, tzinfo=timezone.utc)
+DATES_SPAN = 8 * 365 * 24 * 3600
+
+# CSV columns of every table, the same layout convert_csv loads
+CSV_LAYOUT = {
+    User: ('id', 'username', 'email', 'role', 'bio', 'first_name',
+           'last_name'),
+    Category: ('id', 'name', 'slug'),
+    Genre: ('id', 'name', 'slug'),
+    Title: ('id', 'name', 'year', 'category_id'),
+    Review: ('id', 'title_id', 'text', 'author_id', 'score', 'pub_date'),
+    Comment: ('id', 'review_id', 'text', 'author_id', 'pub_date'),
+    Title.genre.through: ('id', 'title_id', 'genre_id'),
+}
+CSV_FILES = {
+    User: 'users.csv',
+    Category: 'category.csv',
+    Genre: 'genre.csv',
+    Title: 'titles.csv',
+    Review: 'review.csv',
+    Comment: 'comments.csv',
+    Title.genre.through: 'genre_title.csv',
+}
+
+
+class DatasetSpec:
+    """
+    Size and shape of a generated dataset.
+    """
+
+    def __init__(self, users=100, categories=3, genres=15, titles=1000,
+                 reviews=10000, comments_per_review=1.0, zipf_exponent=1.1,
+                 seed=0):
+        self.users = users
+        self.categories = categories
+        self.genres = genres
+        self.titles = titles
+        self.reviews = reviews
+        self.comments_per_review = comments_per_review
+        self.zipf_exponent = zipf_exponent
+        self.seed = seed
+
+
+class DatasetGenerator:
+    """
+    Deterministic generator of rows for every table.
+    Each table draws from its own random stream seeded from the spec seed,
+    so the rows of a table do not depend on the sizes of the others.
+    Ids start right after `first_ids` (the current maximum per model).
+    """
+
+    def __init__(self, spec, first_ids=None):
+        self.spec = spec
+        first_ids = first_ids or {}
+        self.first_id = {
+            model: first_ids.get(model, 0) + 1 for model in CSV_LAYOUT
+        }
+        self.review_counts = self._review_counts()
+
+    def random(self, name):
+        return random.Random(f'{self.spec.seed}-{name}')
+
+    def id_range(self, model, size):
+        return range(self.first_id[model], self.first_id[model] + size)
+
+    def texts(self, rng, amount=512):
+        return [
+            ' '.join(rng.choices(WORDS, k=rng.randint(5, 40))).capitalize()
+            for _ in range(amount)
+        ]
+
+    def dates(self, rng, amount):
+        return [
+            DATES_START + timedelta(seconds=rng.random() * DATES_SPAN)
+            for _ in range(amount)
+        ]
+
+    def _review_counts(self):
+        """
+        Zipf-distributed number of reviews of every title, in title order.
+        A user reviews a title only once, so counts are capped by users
+        and the excess is spread over the less popular titles.
+        """
+        spec = self.spec
+        if not spec.titles:
+            return []
+        target = min(spec.reviews, spec.users * spec.titles)
+        weights = [
+            1 / rank ** spec.zipf_exponent
+            for rank in range(1, spec.titles + 1)
+        ]
+        counts = [0.0] * spec.titles
+        capped = 0
+        remaining = target
+        while remaining > 0.5 and capped < spec.titles:
+            # Titles are ranked by weight, so capped ones form a prefix
+            total = sum(weights[capped:])
+            for rank in range(capped, spec.titles):
+                counts[rank] += remaining * weights[rank] / total
+            while capped < spec.titles and counts[capped] >= spec.users:
+                counts[capped] = spec.users
+                capped += 1
+            remaining = target - sum(counts)
+        counts = [int(count) for count in counts]
+        # Hand the rounding leftovers to the most popular titles
+        rank = capped
+        for _ in range(target - sum(counts)):
+            counts[rank % spec.titles] += 1
+            rank += 1
+        # Popular titles are spread over the id range
+        self.random('popularity').shuffle(counts)
+        return counts
+
+    def users(self):
+        rng = self.random('users')
+        for user_id in self.id_range(User, self.spec.users):
+            role = rng.choices(
+                (User.ROLE_USER, User.ROLE_MODERATOR, User.ROLE_ADMIN),
+                cum_weights=(95, 99, 100)
+            )[0]
+            yield (
+                user_id, f'user{user_id}', f'user{user_id}@yamdb.fake',
+                role, '', '', ''
+            )
+
+    def categories(self):
+        for category_id in self.id_range(Category, self.spec.categories):
+            yield (
+                category_id, f'Категория {category_id}',
+                f'category-{category_id}'
+            )
+
+    def genres(self):
+        for genre_id in self.id_range(Genre, self.spec.genres):
+            yield genre_id, f'Жанр {genre_id}', f'genre-{genre_id}'
+
+    def titles(self):
+        rng = self.random('titles')
+        category_ids = self.id_range(Category, self.spec.categories)
+        this_year = datetime.now().year
+        for title_id in self.id_range(Title, self.spec.titles):
+            category_id = rng.choice(category_ids) if category_ids else None
+            yield (
+                title_id, f'Произведение {title_id}',
+                rng.randint(1900, this_year), category_id
+            )
+
+    def genre_titles(self):
+        rng = self.random('genre_titles')
+        genre_ids = self.id_range(Genre, self.spec.genres)
+        row_id = self.first_id[Title.genre.through]
+        for title_id in self.id_range(Title, self.spec.titles):
+            amount = min(len(genre_ids), rng.randint(1, 3))
+            for genre_id in rng.sample(genre_ids, amount):
+                yield row_id, title_id, genre_id
+                row_id += 1
+
+    def reviews(self):
+        rng = self.random('reviews')
+        texts = self.texts(rng)
+        user_ids = self.id_range(User, self.spec.users)
+        review_id = self.first_id[Review]
+        title_ids = self.id_range(Title, self.spec.titles)
+        for title_id, amount in zip(title_ids, self.review_counts):
+            if not amount:
+                continue
+            # Sorted authors keep the (title, author) index append-only
+            authors = sorted(rng.sample(user_ids, amount))
+            scores = rng.choices(
+                SCORES, cum_weights=SCORE_CUM_WEIGHTS, k=amount
+            )
+            dates = self.dates(rng, amount)
+            for author_id, score, pub_date in zip(authors, scores, dates):
+                yield (
+                    review_id, title_id, rng.choice(texts), author_id,
+                    score, pub_date
+                )
+                review_id += 1
+
+    def comments(self):
+        rng = self.random('comments')
+        texts = self.texts(rng)
+        mean = self.spec.comments_per_review
+        user_ids = self.id_range(User, self.spec.users)
+        comment_id = self.first_id[Comment]
+        reviews = self.id_range(Review, sum(self.review_counts))
+        for review_id in reviews:
+            amount = round(rng.expovariate(1 / mean)) if mean else 0
+            for _ in range(amount):
+                pub_date = DATES_START + timedelta(
+                    seconds=rng.random() * DATES_SPAN
+                )
+                yield (
+                    comment_id, review_id, rng.choice(texts),
+                    rng.choice(user_ids), pub_date
+                )
+                comment_id += 1
+
+    def tables(self):
+        # Tables in foreign key dependency order
+        return (
+            (User, self.users()),
+            (Category, self.categories()),
+            (Genre, self.genres()),
+            (Title, self.titles()),
+            (Title.genre.through, self.genre_titles()),
+            (Review, self.reviews()),
+            (Comment, self.comments()),
+        )
+
+
+def _constant_columns(model, columns):
+    # Defaults of the columns missing from the CSV layout
+    return {
+        field.column: field.get_db_prep_save(field.get_default(), connection)
+        for field in model._meta.concrete_fields
+        if field.attname not in columns
+    }
+
+
+def _datetime_adapter():
+    """
+    Fast equivalent of connection.ops.adapt_datetimefield_value
+    for the aware datetimes the generator produces.
+    """
+    if connection.features.supports_timezones:
+        return lambda value: value
+    db_timezone = connection.timezone
+    return lambda value: str(
+        value.astimezone(db_timezone).replace(tzinfo=None)
+    )
+
+
+def _drop_secondary_indexes(model):
+    """
+    Drop the secondary indexes and triggers of a SQLite table and return
+    the statements recreating them. Building an index once over the loaded
+    rows is much cheaper than updating it on every random insert.
+    """
+    if connection.vendor != 'sqlite':
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT type, name, sql FROM sqlite_master "
+            "WHERE type IN ('index', 'trigger') AND tbl_name = %s "
+            "AND sql IS NOT NULL",
+            [model._meta.db_table],
+        )
+        objects = cursor.fetchall()
+        for kind, name, _ in objects:
+            cursor.execute(
+                f'DROP {kind.upper()} {connection.ops.quote_name(name)}'
+            )
+    return [sql for _, _, sql in objects]
+
+
+def write_table(model, columns, rows, batch_size, progress=None):
+    """
+    Insert tuples of `columns` with executemany, one transaction per batch.
+    Model instances are never built, which keeps millions of rows cheap.
+    On SQLite the secondary indexes are rebuilt after the load and the
+    full-text index is filled in one statement instead of by triggers.
+    """
+    constants = _constant_columns(model, columns)
+    adapt_datetime = _datetime_adapter()
+    adapters = [
+        adapt_datetime
+        if isinstance(model._meta.get_field(column), models.DateTimeField)
+        else None
+        for column in columns
+    ]
+    db_columns = [model._meta.get_field(column).column for column in columns]
+    db_columns += list(constants)
+    constant_values = tuple(constants.values())
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        quote(model._meta.db_table),
+        ', '.join(quote(column) for column in db_columns),
+        ', '.join(['%s'] * len(db_columns)),
+    )
+    adapted = [index for index, adapter in enumerate(adapters) if adapter]
+    result = ImportResult(model)
+    first_id = (
+        model.objects.aggregate(last=models.Max('pk'))['last'] or 0
+    ) + 1
+    recreate_indexes = _drop_secondary_indexes(model)
+    try:
+        _insert_batches(
+            sql, rows, batch_size, adapters, adapted, constant_values,
+            result, progress
+        )
+    finally:
+        with connection.cursor() as cursor:
+            for index_sql in recreate_indexes:
+                cursor.execute(index_sql)
+    if any('CREATE TRIGGER' in statement for statement in recreate_indexes):
+        search.index_rows(connection, model, first_id)
+    reset_sequences([model])
+    result.finished = time.monotonic()
+    return result
+
+
+def _insert_batches(sql, rows, batch_size, adapters, adapted,
+                    constant_values, result, progress):
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        if adapted:
+            batch = [list(row) for row in batch]
+            for row in batch:
+                for index in adapted:
+                    row[index] = adapters[index](row[index])
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.executemany(
+                sql, [tuple(row) + constant_values for row in batch]
+            )
+        result.rows += len(batch)
+        result.created += len(batch)
+        if progress is not None:
+            progress(result)
+
+
+def csv_value(value):
+    # Dates are written the way the files in static/data store them
+    if isinstance(value, datetime):
+        return value.isoformat().replace('+00:00', 'Z')
+    return value
+
+
+def write_csv(model, columns, rows, directory, progress=None,
+              batch_size=10000):
+    """
+    Write tuples of `columns` to the CSV file convert_csv expects.
+    """
+    result = ImportResult(model)
+    path = os.path.join(directory, CSV_FILES[model])
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(csv_value(value) for value in row)
+            result.rows += 1
+            if progress is not None and not result.rows % batch_size:
+                progress(result)
+    result.created = result.rows
+    result.finished = time.monotonic()
+    return result
+
+
+def current_max_ids():
+    return {
+        model: model.objects.aggregate(max_id=models.Max('pk'))['max_id'] or 0
+        for model in CSV_LAYOUT
+    }
@@ -0,0 +1,132 @@
+import csv
+import json
+from itertools import islice
+
+from .dataset import CSV_FILES, CSV_LAYOUT, csv_value
+from .models import Category, Genre, Title, User
+
+FORMAT_CSV = 'csv'
+FORMAT_NDJSON = 'ndjson'
+# Content types of the export formats
+FORMATS = {
+    FORMAT_CSV: 'text/csv; charset=utf-8',
+    FORMAT_NDJSON: 'application/x-ndjson; charset=utf-8',
+}
+
+# Exported tables by the name of their CSV file in static/data
+DATASETS = {
+    file_name[:-len('.csv')]: model for model, file_name in CSV_FILES.items()
+}
+# Tables only the management command exports
+PRIVATE_MODELS = (User,)
+# Columns beyond the static/data layout; convert_csv loads them as well
+EXTRA_COLUMNS = {
+    Title: ('description',),
+}
+
+
+def export_columns(model):
+    return CSV_LAYOUT[model] + EXTRA_COLUMNS.get(model, ())
+
+
+def is_public(dataset):
+    return DATASETS.get(dataset) not in (None, *PRIVATE_MODELS)
+
+
+def export_rows(model, columns, chunk_size):
+    """
+    Yield lists of up to `chunk_size` value tuples in primary key order.
+    The rows come from a chunked iterator, so memory use does not depend
+    on the size of the table.
+    """
+    rows = (
+        model.objects.order_by('pk')
+        .values_list(*columns)
+        .iterator(chunk_size=chunk_size)
+    )
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Line:
+    # File-like target of csv.writer returning the formatted line
+
+    def write(self, value):
+        return value
+
+
+def csv_chunks(model, chunk_size=2000):
+    """
+    Yield the table as CSV text in the layout convert_csv loads.
+    """
+    columns = export_columns(model)
+    writer = csv.writer(_Line())
+    yield writer.writerow(columns)
+    for chunk in export_rows(model, columns, chunk_size):
+        yield ''.join(
+            writer.writerow([csv_value(value) for value in row])
+            for row in chunk
+        )
+
+
+def _genre_slugs(title_ids, genres):
+    # Genre slugs of a chunk of titles in one query
+    slugs = {title_id: [] for title_id in title_ids}
+    links = (
+        Title.genre.through.objects.filter(title_id__in=title_ids)
+        .order_by('title_id', 'genre_id')
+        .values_list('title_id', 'genre_id')
+    )
+    for title_id, genre_id in links:
+        slugs[title_id].append(genres[genre_id])
+    return slugs
+
+
+def _title_records(chunk_size):
+    # Titles carry the slugs of their genres and category and the rating
+    columns = export_columns(Title) + ('rating',)
+    categories = dict(Category.objects.values_list('pk', 'slug'))
+    genres = dict(Genre.objects.values_list('pk', 'slug'))
+    for chunk in export_rows(Title, columns, chunk_size):
+        slugs = _genre_slugs([row[0] for row in chunk], genres)
+        records = []
+        for row in chunk:
+            record = dict(zip(columns, row))
+            record['genre'] = slugs[record['id']]
+            record['category'] = categories.get(record['category_id'])
+            records.append(record)
+        yield records
+
+
+def _records(model, chunk_size):
+    if model is Title:
+        yield from _title_records(chunk_size)
+        return
+    columns = export_columns(model)
+    for chunk in export_rows(model, columns, chunk_size):
+        yield [
+            {column: csv_value(value) for column, value in zip(columns, row)}
+            for row in chunk
+        ]
+
+
+def ndjson_chunks(model, chunk_size=2000):
+    """
+    Yield the table as newline delimited JSON, one object per row.
+    """
+    for records in _records(model, chunk_size):
+        yield ''.join(
+            json.dumps(record, ensure_ascii=False) + '\n'
+            for record in records
+        )
+
+
+def export_chunks(model, file_format, chunk_size=2000):
+    if file_format == FORMAT_CSV:
+        return csv_chunks(model, chunk_size)
+    if file_format == FORMAT_NDJSON:
+        return ndjson_chunks(model, chunk_size)
+    raise ValueError(f'Unknown export format: {file_format}')
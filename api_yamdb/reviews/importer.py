@@ -0,0 +1,133 @@
+import time
+from csv import DictReader
+from itertools import islice
+
+from django.core.management.color import no_style
+from django.db import connection, transaction
+
+MODE_INSERT = 'insert'
+MODE_SKIP = 'skip'
+MODE_UPSERT = 'upsert'
+MODES = (MODE_INSERT, MODE_SKIP, MODE_UPSERT)
+
+
+class ImportResult:
+    """
+    Counters of a single CSV import.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.rows = 0
+        self.created = 0
+        self.updated = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+    @property
+    def seconds(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self):
+        return (
+            f'{self.model._meta.label}: {self.rows} rows '
+            f'({self.created} created, {self.updated} updated) '
+            f'in {self.seconds:.2f}s, {self.rows_per_second:.0f} rows/s'
+        )
+
+
+def _column_map(model, columns):
+    """
+    Map CSV columns to model attribute names.
+    A column named after a foreign key (`author`, `category`) holds
+    the id of the related row and is written straight to `author_id`,
+    so no per-row lookup of the related object is needed.
+    """
+    mapping = {}
+    for column in columns:
+        field = model._meta.get_field(column)
+        mapping[column] = field.attname
+    return mapping
+
+
+def _build(model, mapping, nullable, row):
+    data = {}
+    for column, attname in mapping.items():
+        value = row[column]
+        if value == '' and attname in nullable:
+            value = None
+        data[attname] = value
+    return model(**data)
+
+
+def _write_batch(model, objs, mode, update_fields, result):
+    with transaction.atomic():
+        if mode == MODE_INSERT:
+            model.objects.bulk_create(objs)
+            result.created += len(objs)
+            return
+        pk_name = model._meta.pk.attname
+        existing = set(
+            model.objects.filter(
+                pk__in=[getattr(obj, pk_name) for obj in objs]
+            ).values_list('pk', flat=True)
+        )
+        existing = {str(pk) for pk in existing}
+        new = [obj for obj in objs if str(obj.pk) not in existing]
+        model.objects.bulk_create(new)
+        result.created += len(new)
+        if mode == MODE_UPSERT and update_fields:
+            old = [obj for obj in objs if str(obj.pk) in existing]
+            model.objects.bulk_update(old, update_fields)
+            result.updated += len(old)
+
+
+def import_csv(model, path, batch_size=1000, mode=MODE_SKIP,
+               progress=None):
+    """
+    Stream a CSV file into the table of `model` in batches.
+    Every batch is inserted with `bulk_create` in its own transaction.
+    In `skip` mode rows whose primary key already exists are left as they
+    are, in `upsert` mode they are overwritten with the CSV values.
+    `progress` is called with the running ImportResult after each batch.
+    """
+    if mode not in MODES:
+        raise ValueError(f'Unknown import mode: {mode}')
+    result = ImportResult(model)
+    with open(path, encoding='utf-8') as file:
+        reader = DictReader(file)
+        mapping = _column_map(model, reader.fieldnames)
+        nullable = {
+            field.attname for field in model._meta.concrete_fields
+            if field.null
+        }
+        pk_name = model._meta.pk.attname
+        update_fields = [
+            field.name for field in model._meta.concrete_fields
+            if field.attname in mapping.values() and field.attname != pk_name
+        ]
+        while True:
+            rows = list(islice(reader, batch_size))
+            if not rows:
+                break
+            objs = [_build(model, mapping, nullable, row) for row in rows]
+            _write_batch(model, objs, mode, update_fields, result)
+            result.rows += len(rows)
+            if progress is not None:
+                progress(result)
+    reset_sequences([model])
+    result.finished = time.monotonic()
+    return result
+
+
+def reset_sequences(models):
+    # Explicit ids bypass the sequences of backends that use them
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
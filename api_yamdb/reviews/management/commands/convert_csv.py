@@ -1,10 +1,14 @@
-import logging
-from csv import DictReader
+import os
 
 from django.core.management.base import BaseCommand
+from reviews.counters import rebuild_comment_counts
+from reviews.importer import MODE_SKIP, MODES, import_csv
 from reviews.models import Category, Comment, Genre, Review, Title, User
+from reviews.ratings import rebuild_ratings
+from reviews.signals import data_rebuilt
 
-# Dictionary mapping models to their corresponding CSV files
+# Dictionary mapping models to their corresponding CSV files.
+# The order respects foreign key dependencies between the tables.
 TABLES = {
     User: "users.csv",
     Category: "category.csv",
@@ -18,21 +22,59 @@ TABLES = {
 
 class Command(BaseCommand):
     # Show this when the user types help
-    help = "Loads data from user.csv"
+    help = "Loads data from the CSV files in static/data"
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--data-dir",
+            default="./static/data",
+            help="Directory with the CSV files",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Rows inserted per transaction",
+        )
+        parser.add_argument(
+            "--mode",
+            choices=MODES,
+            default=MODE_SKIP,
+            help=(
+                "insert: plain inserts, fails on existing ids; "
+                "skip: keep existing rows; "
+                "upsert: overwrite existing rows"
+            ),
+        )
+
+    def report_progress(self, result):
+        self.stdout.write(
+            f"  {result.model._meta.label}: {result.rows} rows, "
+            f"{result.rows_per_second:.0f} rows/s"
+        )
+
+    def handle(self, *args, **options):
+        progress = self.report_progress if options["verbosity"] > 1 else None
+        total_rows = 0
+        reviews_loaded = comments_loaded = False
         # Iterate over the models and their respective CSV files
         for model, csv in TABLES.items():
-            # Open the CSV file
-            with open(f"./static/data/{csv}", encoding="utf-8") as file:
-                # Create a dictionary reader for the CSV file
-                reader = DictReader(file)
-                # Iterate over each row in the CSV file
-                for data in reader:
-                    # Get or create an object of the current model using the row data
-                    obj, created = model.objects.get_or_create(**data)
-                    # Check if the object was newly created or already existed
-                    if created:
-                        logging.info(self.style.SUCCESS(f"Created {obj}"))
-                    else:
-                        logging.warning(f"{obj} already exists")
+            result = import_csv(
+                model,
+                os.path.join(options["data_dir"], csv),
+                batch_size=options["batch_size"],
+                mode=options["mode"],
+                progress=progress,
+            )
+            total_rows += result.rows
+            reviews_loaded |= model is Review and result.rows > 0
+            comments_loaded |= model is Comment and result.rows > 0
+            self.stdout.write(self.style.SUCCESS(str(result)))
+        if reviews_loaded:
+            # Bulk inserts bypass the signals maintaining title ratings
+            rebuild_ratings()
+        if reviews_loaded or comments_loaded:
+            rebuild_comment_counts()
+        if total_rows:
+            data_rebuilt.send(sender=self.__class__)
+        self.stdout.write(self.style.SUCCESS(f"Imported {total_rows} rows"))
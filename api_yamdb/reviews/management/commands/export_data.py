@@ -0,0 +1,55 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from reviews.export import DATASETS, FORMAT_CSV, FORMATS, export_chunks
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Exports tables as CSV files in the static/data layout "
+        "(convert_csv loads them back) or as NDJSON"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "datasets",
+            nargs="*",
+            help=f"Tables to export, all by default: {', '.join(DATASETS)}",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=".",
+            help="Directory the files are written to",
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default=FORMAT_CSV,
+            dest="file_format",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows fetched per query",
+        )
+
+    def handle(self, *args, **options):
+        datasets = options["datasets"] or list(DATASETS)
+        unknown = set(datasets) - set(DATASETS)
+        if unknown:
+            raise CommandError(f"Unknown datasets: {', '.join(unknown)}")
+        os.makedirs(options["output_dir"], exist_ok=True)
+        for dataset in datasets:
+            path = os.path.join(
+                options["output_dir"], f"{dataset}.{options['file_format']}"
+            )
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                for chunk in export_chunks(
+                    DATASETS[dataset],
+                    options["file_format"],
+                    options["chunk_size"],
+                ):
+                    file.write(chunk)
+            self.stdout.write(self.style.SUCCESS(f"Exported {path}"))
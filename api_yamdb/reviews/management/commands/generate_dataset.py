@@ -0,0 +1,91 @@
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from reviews.dataset import (CSV_LAYOUT, DatasetGenerator, DatasetSpec,
+                             current_max_ids, write_csv, write_table)
+from reviews.counters import rebuild_comment_counts
+from reviews.ratings import rebuild_ratings
+from reviews.signals import data_rebuilt
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = "Generates a synthetic dataset for load and scale testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--categories", type=int, default=3)
+        parser.add_argument("--genres", type=int, default=15)
+        parser.add_argument("--titles", type=int, default=10000)
+        parser.add_argument(
+            "--reviews",
+            type=int,
+            default=100000,
+            help="Approximate total of reviews, spread by Zipf's law",
+        )
+        parser.add_argument(
+            "--comments-per-review",
+            type=float,
+            default=1.0,
+            help="Mean number of comments per review",
+        )
+        parser.add_argument("--zipf-exponent", type=float, default=1.1)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10000,
+            help="Rows inserted per transaction",
+        )
+        parser.add_argument(
+            "--csv-dir",
+            help=(
+                "Write the dataset as CSV files in the convert_csv layout "
+                "instead of inserting it into the database"
+            ),
+        )
+
+    def report_progress(self, result):
+        self.stdout.write(
+            f"  {result.model._meta.label}: {result.rows} rows, "
+            f"{result.rows_per_second:.0f} rows/s"
+        )
+
+    def handle(self, *args, **options):
+        spec = DatasetSpec(
+            users=options["users"],
+            categories=options["categories"],
+            genres=options["genres"],
+            titles=options["titles"],
+            reviews=options["reviews"],
+            comments_per_review=options["comments_per_review"],
+            zipf_exponent=options["zipf_exponent"],
+            seed=options["seed"],
+        )
+        progress = self.report_progress if options["verbosity"] > 1 else None
+        csv_dir = options["csv_dir"]
+        if csv_dir:
+            os.makedirs(csv_dir, exist_ok=True)
+            generator = DatasetGenerator(spec)
+        else:
+            # Append to the existing data
+            generator = DatasetGenerator(spec, current_max_ids())
+            if connection.vendor == "sqlite":
+                # A larger page cache keeps random index inserts in memory
+                with connection.cursor() as cursor:
+                    cursor.execute("PRAGMA cache_size = -262144")
+        for model, rows in generator.tables():
+            columns = CSV_LAYOUT[model]
+            if csv_dir:
+                result = write_csv(model, columns, rows, csv_dir, progress)
+            else:
+                result = write_table(
+                    model, columns, rows, options["batch_size"], progress
+                )
+            self.stdout.write(self.style.SUCCESS(str(result)))
+        if not csv_dir:
+            # Raw inserts bypass the signals maintaining the counters
+            rebuild_ratings()
+            rebuild_comment_counts()
+            data_rebuilt.send(sender=self.__class__)
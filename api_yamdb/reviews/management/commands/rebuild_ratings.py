@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from reviews.ratings import rebuild_ratings
+from reviews.signals import data_rebuilt
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = "Recalculates the stored rating of every title from its reviews"
+
+    def handle(self, *args, **kwargs):
+        updated = rebuild_ratings()
+        data_rebuilt.send(sender=self.__class__)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt ratings of {updated} titles")
+        )
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from reviews.counters import reconcile_counters
+from reviews.signals import data_rebuilt
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Repairs the stored review counts and ratings of titles and the "
+        "comment counts of reviews that drifted from the actual rows"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Titles or reviews checked per transaction",
+        )
+
+    def report_progress(self, model, done, total):
+        self.stdout.write(f"  {model._meta.label}: {done}/{total}")
+
+    def handle(self, *args, **options):
+        progress = self.report_progress if options["verbosity"] > 1 else None
+        repaired = reconcile_counters(options["chunk_size"], progress)
+        data_rebuilt.send(sender=self.__class__)
+        for model, rows in repaired.items():
+            self.stdout.write(self.style.SUCCESS(
+                f"Repaired {rows} {model._meta.verbose_name_plural}"
+            ))
@@ -0,0 +1,57 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    # Show this when the user types help
+    help = (
+        "Copies the default SQLite database into the files of the replica "
+        "databases with the SQLite online backup API"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "aliases",
+            nargs="*",
+            help="Replica aliases to refresh, DATABASE_REPLICAS by default",
+        )
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=-1,
+            help="Pages copied per step, -1 copies the database in one step",
+        )
+
+    def target_path(self, alias, source):
+        if alias == DEFAULT_DB_ALIAS or alias not in connections:
+            raise CommandError(f"{alias} is not a replica alias")
+        target = connections[alias]
+        if target.vendor != "sqlite":
+            raise CommandError(f"{alias} is not an SQLite database")
+        path = target.settings_dict["NAME"]
+        if str(path) == str(source.settings_dict["NAME"]):
+            raise CommandError(f"{alias} is the default database")
+        return path
+
+    def handle(self, *args, **options):
+        aliases = options["aliases"] or settings.DATABASE_REPLICAS
+        if not aliases:
+            raise CommandError(
+                "No replicas: list them in DATABASE_REPLICAS or pass aliases"
+            )
+        source = connections[DEFAULT_DB_ALIAS]
+        if source.vendor != "sqlite":
+            raise CommandError("The default database is not SQLite")
+        paths = {alias: self.target_path(alias, source) for alias in aliases}
+        source.ensure_connection()
+        for alias, path in paths.items():
+            # Open readers of the replica keep their snapshot meanwhile
+            target = sqlite3.connect(path)
+            try:
+                source.connection.backup(target, pages=options["pages"])
+            finally:
+                target.close()
+            self.stdout.write(self.style.SUCCESS(f"Copied to {alias}: {path}"))
@@ -0,0 +1,67 @@
+# Generated by Django 3.2 on 2026-10-18 20:10
+
+from django.db import migrations
+
+# The SQL of this migration is frozen: later changes to reviews.search
+# must not change what it creates on a fresh database.
+# unicode61 folds the case of Cyrillic (and any other) letters,
+# remove_diacritics folds "ё" into "е"
+TOKENIZER = 'unicode61 remove_diacritics 2'
+# FTS5 table -> (external content table, indexed columns)
+SEARCH_INDEXES = {
+    'reviews_title_fts': ('reviews_title', ('name', 'description')),
+    'reviews_review_fts': ('reviews_review', ('text',)),
+}
+
+
+def trigger_sql(fts, table, columns):
+    names = ', '.join(columns)
+    new = ', '.join(f'new.{column}' for column in columns)
+    old = ', '.join(f'old.{column}' for column in columns)
+    insert = f'INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new});'
+    delete = (
+        f"INSERT INTO {fts}({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old});"
+    )
+    return [
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {table} '
+        f'BEGIN {insert} END',
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {table} '
+        f'BEGIN {delete} END',
+        f'CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {names} '
+        f'ON {table} BEGIN {delete} {insert} END',
+    ]
+
+
+def forwards(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for fts, (table, columns) in SEARCH_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{', '.join(columns)}, content='{table}', "
+            f"content_rowid='id', tokenize='{TOKENIZER}')"
+        )
+        schema_editor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        for sql in trigger_sql(fts, table, columns):
+            schema_editor.execute(sql)
+
+
+def backwards(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for fts in SEARCH_INDEXES:
+        for suffix in ('insert', 'delete', 'update'):
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS {fts}_{suffix}')
+        schema_editor.execute(f'DROP TABLE IF EXISTS {fts}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_queuedemail'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 3.2 on 2026-10-18 20:23
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Full-text triggers of the review table as 0008_search_index created
+# them, frozen so that later changes to reviews.search do not alter them
+REVIEW_SEARCH_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS reviews_review_fts_insert AFTER INSERT ON "
+    "reviews_review BEGIN INSERT INTO reviews_review_fts(rowid, text) "
+    "VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_review_fts_delete AFTER DELETE ON "
+    "reviews_review BEGIN INSERT INTO reviews_review_fts(reviews_review_fts, "
+    "rowid, text) VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS reviews_review_fts_update AFTER UPDATE OF "
+    "text ON reviews_review BEGIN INSERT INTO reviews_review_fts("
+    "reviews_review_fts, rowid, text) VALUES ('delete', old.id, old.text); "
+    "INSERT INTO reviews_review_fts(rowid, text) VALUES (new.id, new.text); "
+    "END",
+]
+
+
+def fill_comment_counts(apps, schema_editor):
+    Review = apps.get_model('reviews', 'Review')
+    Comment = apps.get_model('reviews', 'Comment')
+    comments = Comment.objects.filter(
+        review=OuterRef('pk')
+    ).order_by().values('review').annotate(total=Count('pk')).values('total')
+    Review.objects.update(comment_count=Coalesce(Subquery(comments), 0))
+
+
+def reinstall_search_triggers(apps, schema_editor):
+    # SQLite rebuilt the review table and dropped its full-text triggers
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in REVIEW_SEARCH_TRIGGERS:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_search_index'),
+    ]
+
+    operations = [
+        # Unapplying the field rebuilds the table again
+        migrations.RunPython(
+            migrations.RunPython.noop, reinstall_search_triggers
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='comment_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Number of comments'),
+        ),
+        migrations.RunPython(
+            fill_comment_counts, migrations.RunPython.noop
+        ),
+        migrations.RunPython(
+            reinstall_search_triggers, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 3.2 on 2026-10-19 10:05
+
+from django.db import migrations
+
+
+def purge_sent_messages(apps, schema_editor):
+    # Sent emails must not keep their confirmation codes
+    QueuedEmail = apps.get_model('reviews', 'QueuedEmail')
+    QueuedEmail.objects.filter(sent_at__isnull=False).update(message='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            purge_sent_messages, migrations.RunPython.noop
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import (MaxValueValidator, MinValueValidator)
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 
 from .validators import validate_username, validate_year
 
@@ -148,10 +149,36 @@ class Title(models.Model):
         help_text='Release year of work',
         validators=[validate_year]
     )
+    # Denormalized rating state, maintained by reviews.signals
+    score_sum = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Sum of scores'
+    )
+    review_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Number of reviews'
+    )
+    rating = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Rating',
+        help_text='Average score of reviews'
+    )
 
     class Meta:
         verbose_name = 'Work'
         verbose_name_plural = 'Works'
+        indexes = [
+            # Filters of TitleFilter, alone and within a category
+            models.Index(fields=['year'], name='title_year_idx'),
+            models.Index(fields=['name'], name='title_name_idx'),
+            models.Index(
+                fields=['category', 'year'], name='title_category_year_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -186,6 +213,12 @@ class Review(models.Model):
         db_index=True,
         verbose_name='Add date'
     )
+    # Denormalized number of comments, maintained by reviews.signals
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Number of comments'
+    )
 
     class Meta:
         constraints = [
@@ -194,6 +227,19 @@ class Review(models.Model):
                 name='review_only_once'
             )
         ]
+        indexes = [
+            # Keyset pagination of the reviews of a title
+            models.Index(fields=['title', 'id'], name='review_title_id_idx'),
+            # The reviews of a title by date
+            models.Index(
+                fields=['title', 'pub_date'], name='review_title_pub_date_idx'
+            ),
+        ]
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        # Keep the row and the title rating in one transaction
+        super().save(*args, **kwargs)
 
 
 class Comment(models.Model):
@@ -221,3 +267,78 @@ class Comment(models.Model):
         db_index=True,
         verbose_name='Add date'
     )
+
+    class Meta:
+        indexes = [
+            # Keyset pagination of the comments of a review
+            models.Index(
+                fields=['review', 'id'], name='comment_review_id_idx'
+            ),
+            # The comments of a review by date
+            models.Index(
+                fields=['review', 'pub_date'],
+                name='comment_review_pub_date_idx'
+            ),
+        ]
+
+    @transaction.atomic
+    def save(self, *args, **kwargs):
+        # Keep the row and the review comment count in one transaction
+        super().save(*args, **kwargs)
+
+
+class QueuedEmail(models.Model):
+    """
+    Outgoing email waiting to be delivered by the send_queued_mail command.
+    """
+
+    subject = models.CharField(
+        max_length=255,
+        verbose_name='Subject'
+    )
+    message = models.TextField(
+        verbose_name='Message'
+    )
+    from_email = models.EmailField(
+        max_length=254,
+        verbose_name='Sender'
+    )
+    recipient = models.EmailField(
+        max_length=254,
+        verbose_name='Recipient'
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Queued at'
+    )
+    send_after = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Next attempt at'
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='Failed attempts'
+    )
+    sent_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Sent at'
+    )
+    last_error = models.TextField(
+        blank=True,
+        verbose_name='Last error'
+    )
+
+    class Meta:
+        verbose_name = 'queued email'
+        verbose_name_plural = 'queued emails'
+        indexes = [
+            # Lookup of the emails due for delivery
+            models.Index(
+                fields=['sent_at', 'send_after'],
+                name='queuedemail_pending_idx'
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.subject} to {self.recipient}'
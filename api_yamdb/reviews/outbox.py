@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+
+from .models import QueuedEmail
+
+
+def enqueue_email(subject, message, from_email, recipient):
+    """
+    Store an email for delivery by the send_queued_mail command.
+    """
+    return QueuedEmail.objects.create(
+        subject=subject,
+        message=message,
+        from_email=from_email,
+        recipient=recipient,
+    )
+
+
+def pending_emails(now=None):
+    return QueuedEmail.objects.filter(
+        sent_at__isnull=True,
+        send_after__lte=now or timezone.now(),
+        attempts__lt=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+    ).order_by('send_after', 'pk')
+
+
+def claim_emails(batch_size, now=None):
+    """
+    Lease up to `batch_size` due emails to the calling worker: their
+    send_after moves EMAIL_OUTBOX_LEASE seconds ahead, so concurrent
+    workers skip them. Emails of a worker that dies are sent again once
+    the lease is over.
+    """
+    now = now or timezone.now()
+    lease_until = now + timedelta(seconds=settings.EMAIL_OUTBOX_LEASE)
+    ids = list(pending_emails(now).values_list('pk', flat=True)[:batch_size])
+    if not ids:
+        return []
+    # The update re-checks that the emails are due, so only one worker
+    # moves them to its lease
+    QueuedEmail.objects.filter(
+        pk__in=ids, sent_at__isnull=True, send_after__lte=now
+    ).update(send_after=lease_until)
+    return list(QueuedEmail.objects.filter(
+        pk__in=ids, sent_at__isnull=True, send_after=lease_until
+    ).order_by('pk'))
+
+
+def send_queued_emails(batch_size=None):
+    """
+    Deliver one batch of due emails over a single SMTP connection.
+    A failed email is retried later with an exponentially growing delay
+    until EMAIL_OUTBOX_MAX_ATTEMPTS is reached. The body of a sent email,
+    which holds the confirmation code, is not kept.
+    Returns a (sent, failed) tuple.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    batch = claim_emails(batch_size)
+    if not batch:
+        return 0, 0
+    sent, failed = [], []
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        for email in batch:
+            _schedule_retry(email, error)
+        QueuedEmail.objects.bulk_update(
+            batch, ['attempts', 'send_after', 'last_error']
+        )
+        return 0, len(batch)
+    try:
+        for email in batch:
+            message = EmailMessage(
+                email.subject,
+                email.message,
+                email.from_email,
+                [email.recipient],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as error:
+                _schedule_retry(email, error)
+                failed.append(email)
+            else:
+                email.sent_at = timezone.now()
+                email.message = ''
+                sent.append(email)
+    finally:
+        connection.close()
+    QueuedEmail.objects.bulk_update(sent, ['sent_at', 'message'])
+    QueuedEmail.objects.bulk_update(
+        failed, ['attempts', 'send_after', 'last_error']
+    )
+    return len(sent), len(failed)
+
+
+def _schedule_retry(email, error):
+    delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** email.attempts
+    email.attempts += 1
+    email.send_after = timezone.now() + timedelta(seconds=delay)
+    email.last_error = f'{type(error).__name__}: {error}'
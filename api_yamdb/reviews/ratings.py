@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Sum, When
+from django.db.models.functions import Coalesce
+
+from .models import Review, Title
+
+
+def apply_review_delta(title_id, score_delta, count_delta):
+    """
+    Shift the stored rating state of a title by the given deltas.
+    All expressions are evaluated by the database against the current
+    row values, so concurrent writers never overwrite each other.
+    """
+    new_sum = F('score_sum') + score_delta
+    new_count = F('review_count') + count_delta
+    Title.objects.filter(pk=title_id).update(
+        score_sum=new_sum,
+        review_count=new_count,
+        rating=Case(
+            When(review_count=-count_delta, then=None),
+            default=new_sum / new_count,
+        ),
+    )
+
+
+def rebuild_ratings(queryset=None):
+    """
+    Recompute the rating state of titles from their reviews.
+    Returns the number of updated titles.
+    """
+    if queryset is None:
+        queryset = Title.objects.all()
+    reviews = Review.objects.filter(
+        title=OuterRef('pk')
+    ).order_by().values('title')
+    score_sum = Subquery(
+        reviews.annotate(total=Sum('score')).values('total')
+    )
+    review_count = Subquery(
+        reviews.annotate(total=Count('pk')).values('total')
+    )
+    with transaction.atomic():
+        updated = queryset.update(
+            score_sum=Coalesce(score_sum, 0),
+            review_count=Coalesce(review_count, 0),
+        )
+        queryset.filter(review_count=0).update(rating=None)
+        queryset.filter(review_count__gt=0).update(
+            rating=F('score_sum') / F('review_count')
+        )
+    return updated
@@ -0,0 +1,83 @@
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Review, Title
+
+# Full-text indexed columns per model. The FTS5 tables use the model
+# tables as external content and are kept in sync by triggers; the
+# migrations create both
+SEARCH_INDEXES = {
+    Title: ('name', 'description'),
+    Review: ('text',),
+}
+
+
+def index_table(model):
+    return f'{model._meta.db_table}_fts'
+
+
+def is_supported(connection):
+    return connection.vendor == 'sqlite'
+
+
+def index_rows(connection, model, min_id):
+    """
+    Index rows loaded while the triggers were disabled.
+    """
+    if model not in SEARCH_INDEXES or not is_supported(connection):
+        return
+    columns = ', '.join(SEARCH_INDEXES[model])
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {index_table(model)}(rowid, {columns}) '
+            f'SELECT id, {columns} FROM {model._meta.db_table} '
+            f'WHERE id >= %s',
+            [min_id],
+        )
+
+
+def match_query(text):
+    """
+    Turn user input into a safe FTS5 query: every word becomes a quoted
+    prefix term and all of them must match.
+    """
+    return ' '.join(f'"{word}"*' for word in re.findall(r'\w+', text))
+
+
+def search(queryset, text, ranked=True):
+    """
+    Filter `queryset` by full-text `text` and order it by relevance.
+    Unranked results can be used inside subqueries.
+    Backends without FTS5 fall back to case-insensitive substring search.
+    """
+    model = queryset.model
+    query = match_query(text)
+    if not query:
+        return queryset.none()
+    if not is_supported(connections[queryset.db]):
+        return _fallback_search(queryset, text)
+    fts = index_table(model)
+    if not ranked:
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT rowid FROM {fts} WHERE {fts} MATCH %s', [query]
+        ))
+    return queryset.extra(
+        tables=[fts],
+        where=[
+            f'{fts}.rowid = {model._meta.db_table}.id',
+            f'{fts} MATCH %s',
+        ],
+        params=[query],
+        select={'search_rank': f'bm25({fts})'},
+        order_by=['search_rank', 'id'],
+    )
+
+
+def _fallback_search(queryset, text):
+    condition = Q()
+    for column in SEARCH_INDEXES[queryset.model]:
+        condition |= Q(**{f'{column}__icontains': text})
+    return queryset.filter(condition)
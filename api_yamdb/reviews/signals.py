@@ -0,0 +1,88 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import Signal, receiver
+
+from .counters import apply_comment_delta, rebuild_comment_counts
+from .models import Comment, Review, Title
+from .ratings import apply_review_delta, rebuild_ratings
+
+# Sent by the bulk loads and repairs that write rows, ratings or counters
+# past the model signals
+data_rebuilt = Signal()
+
+
+def _rating_state(review):
+    # Read raw attributes so deferred fields never trigger a query
+    title_id = review.__dict__.get('title_id')
+    score = review.__dict__.get('score')
+    if title_id is None or score is None:
+        return None
+    return title_id, score
+
+
+@receiver(post_init, sender=Review)
+def remember_rating_state(sender, instance, **kwargs):
+    # Remember the values the title rating currently accounts for
+    instance._rating_state = _rating_state(instance) if instance.pk else None
+
+
+@receiver(post_save, sender=Review)
+def update_rating_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        # Fixture loading: ratings are rebuilt by the rebuild_ratings command
+        return
+    old_state = instance._rating_state
+    if created:
+        apply_review_delta(instance.title_id, instance.score, 1)
+    elif old_state is None:
+        rebuild_ratings(Title.objects.filter(pk=instance.title_id))
+    else:
+        old_title_id, old_score = old_state
+        if old_title_id != instance.title_id:
+            apply_review_delta(old_title_id, -old_score, -1)
+            apply_review_delta(instance.title_id, instance.score, 1)
+        elif old_score != instance.score:
+            apply_review_delta(
+                instance.title_id, instance.score - old_score, 0
+            )
+    instance._rating_state = _rating_state(instance)
+
+
+@receiver(post_delete, sender=Review)
+def update_rating_on_delete(sender, instance, **kwargs):
+    state = instance._rating_state or _rating_state(instance)
+    if state is None:
+        rebuild_ratings(Title.objects.filter(pk=instance.title_id))
+        return
+    title_id, score = state
+    apply_review_delta(title_id, -score, -1)
+
+
+@receiver(post_init, sender=Comment)
+def remember_comment_review(sender, instance, **kwargs):
+    # The review whose comment count currently includes this comment
+    instance._counted_review_id = (
+        instance.__dict__.get('review_id') if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Comment)
+def update_comment_count_on_save(sender, instance, created, raw=False,
+                                 **kwargs):
+    if raw:
+        # Fixture loading: counts are repaired by reconcile_counters
+        return
+    old_review_id = instance._counted_review_id
+    if created:
+        apply_comment_delta(instance.review_id, 1)
+    elif old_review_id is None:
+        rebuild_comment_counts(Review.objects.filter(pk=instance.review_id))
+    elif old_review_id != instance.review_id:
+        apply_comment_delta(old_review_id, -1)
+        apply_comment_delta(instance.review_id, 1)
+    instance._counted_review_id = instance.review_id
+
+
+@receiver(post_delete, sender=Comment)
+def update_comment_count_on_delete(sender, instance, **kwargs):
+    # Also runs for every comment of a deleted review, before the review
+    apply_comment_delta(instance.review_id, -1)
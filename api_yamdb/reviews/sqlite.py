@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+def pragma_statements(pragmas):
+    # journal_mode is applied first: it cannot change inside a transaction
+    names = sorted(pragmas, key=lambda name: name != 'journal_mode')
+    return [f'PRAGMA {name} = {pragmas[name]}' for name in names]
+
+
+def read_pragmas(connection, names):
+    """
+    Return the current values of the pragmas `names` on `connection`.
+    """
+    values = {}
+    with connection.cursor() as cursor:
+        for name in names:
+            cursor.execute(f'PRAGMA {name}')
+            values[name] = cursor.fetchone()[0]
+    return values
+
+
+@receiver(connection_created)
+def configure_connection(sender, connection, **kwargs):
+    """
+    Apply SQLITE_PRAGMAS to every new SQLite connection. Most pragmas
+    last as long as the connection, so with CONN_MAX_AGE they run once
+    per worker thread rather than once per request.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(settings.SQLITE_PRAGMAS):
+            cursor.execute(statement)
@@ -0,0 +1,183 @@
+"""
+Concurrency benchmark of the SQLite connection settings.
+
+Builds a throwaway SQLite database with a generated dataset and runs a
+mixed read/write workload (title and review lists, comment creation) from
+several worker threads, once with the stock SQLite settings (rollback
+journal, FULL synchronous, a new connection per request) and once with
+SQLITE_PRAGMAS and CONN_MAX_AGE from the settings. Reports throughput,
+latency percentiles and failed requests per thread count:
+
+    python benchmarks/concurrency.py --threads 1 4 8 --duration 5
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)
+    )))
+
+from benchmarks.run import (authenticated_client,  # noqa: E402
+                            build_dataset, disable_response_cache,
+                            setup_django)
+
+# Pragmas of a database file Django opens without any tuning
+STOCK_PRAGMAS = {'journal_mode': 'delete', 'synchronous': 'full'}
+
+
+def configure(tuned):
+    """
+    Switch the settings read by new connections and drop the open ones.
+    """
+    from django.conf import settings
+    from django.db import connections
+
+    if not hasattr(configure, 'tuned'):
+        configure.tuned = (
+            settings.SQLITE_PRAGMAS,
+            settings.DATABASES['default']['CONN_MAX_AGE'],
+        )
+    pragmas, max_age = configure.tuned
+    settings.SQLITE_PRAGMAS = pragmas if tuned else STOCK_PRAGMAS
+    settings.DATABASES['default']['CONN_MAX_AGE'] = max_age if tuned else 0
+    connections.close_all()
+    # The journal mode is stored in the file: switch it right away
+    connections['default'].ensure_connection()
+    connections['default'].close()
+
+
+def workload():
+    """
+    Return a function issuing one random request and returning its
+    status code.
+    """
+    from reviews.models import Review, Title, User
+
+    titles = list(Title.objects.values_list('pk', flat=True)[:200])
+    reviews = list(Review.objects.values_list('title_id', 'pk')[:200])
+    users = list(User.objects.filter(role=User.ROLE_USER)[:20])
+
+    def request(random, write_ratio):
+        client = request.clients.get(threading.get_ident())
+        if client is None:
+            client = authenticated_client(random.choice(users))
+            request.clients[threading.get_ident()] = client
+        if random.random() < write_ratio:
+            title_id, review_id = random.choice(reviews)
+            response = client.post(
+                f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/',
+                {'text': 'Benchmark comment'},
+            )
+        elif random.random() < 0.5:
+            response = client.get('/api/v1/titles/', {'limit': 20})
+        else:
+            response = client.get(
+                f'/api/v1/titles/{random.choice(titles)}/reviews/'
+            )
+        return response.status_code
+
+    request.clients = {}
+    return request
+
+
+def run_workers(request, threads, duration, write_ratio, seed):
+    from django.db import close_old_connections, connections
+
+    timings, failures = [], []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(number):
+        generator = random.Random(seed + number)
+        local_timings, local_failures = [], 0
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = request(generator, write_ratio)
+            except Exception:
+                status = 500
+            # What a server does at the end of every request; the test
+            # client skips it
+            close_old_connections()
+            local_timings.append((time.perf_counter() - started) * 1000)
+            local_failures += status >= 400
+        connections.close_all()
+        with lock:
+            timings.extend(local_timings)
+            failures.append(local_failures)
+
+    workers = [
+        threading.Thread(target=worker, args=(number,))
+        for number in range(threads)
+    ]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    quantiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return {
+        'threads': threads,
+        'requests': len(timings),
+        'throughput_rps': round(len(timings) / elapsed, 1),
+        'p50_ms': round(quantiles[49], 3),
+        'p95_ms': round(quantiles[94], 3),
+        'failures': sum(failures),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--titles', type=int, default=1000)
+    parser.add_argument('--reviews', type=int, default=10000)
+    parser.add_argument('--comments-per-review', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 8])
+    parser.add_argument(
+        '--duration', type=float, default=5,
+        help='Seconds every configuration and thread count runs',
+    )
+    parser.add_argument(
+        '--write-ratio', type=float, default=0.2,
+        help='Share of requests creating a comment',
+    )
+    parser.add_argument('--output', help='Write the results to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(os.path.join(directory, 'benchmark.sqlite3'))
+        disable_response_cache()
+        build_dataset(options)
+        request = workload()
+        for name, tuned in (('stock', False), ('tuned', True)):
+            configure(tuned)
+            results[name] = []
+            for threads in options.threads:
+                result = run_workers(
+                    request, threads, options.duration,
+                    options.write_ratio, options.seed,
+                )
+                results[name].append(result)
+                print(name, json.dumps(result))
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(json.dumps(results, indent=2, sort_keys=True) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
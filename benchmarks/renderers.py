@@ -0,0 +1,131 @@
+"""
+Micro-benchmark of the JSON renderers and parsers.
+
+Renders pages of titles and reviews with DRF's JSONRenderer and with
+api.renderers.FastJSONRenderer, parses the result back with both parsers
+and reports the median time per page and the speedup for every page size:
+
+    python benchmarks/renderers.py --page-sizes 10 50 100
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)
+    )))
+
+from benchmarks.run import build_dataset, setup_django  # noqa: E402
+from benchmarks.serializers import resources  # noqa: E402
+
+# Resources of api.rows whose pages are rendered
+PAGES = ('titles', 'reviews')
+
+
+def measure(call, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 4)
+
+
+def compare_json(data, repeat):
+    """
+    Time rendering and parsing of `data` with the stdlib and the fast
+    classes and return the medians in milliseconds.
+    """
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from api.renderers import FastJSONParser, FastJSONRenderer
+
+    content = JSONRenderer().render(data)
+    assert FastJSONRenderer().render(data) == content, (
+        'FastJSONRenderer output differs from JSONRenderer'
+    )
+    result = {'bytes': len(content)}
+    for name, renderer in (
+        ('render', JSONRenderer()), ('fast_render', FastJSONRenderer())
+    ):
+        result[f'{name}_ms'] = measure(
+            lambda: renderer.render(data), repeat
+        )
+    for name, parser in (
+        ('parse', JSONParser()), ('fast_parse', FastJSONParser())
+    ):
+        result[f'{name}_ms'] = measure(
+            lambda: parser.parse(io.BytesIO(content), parser_context={}),
+            repeat,
+        )
+    result['render_speedup'] = round(
+        result['render_ms'] / result['fast_render_ms'], 2
+    )
+    result['parse_speedup'] = round(
+        result['parse_ms'] / result['fast_parse_ms'], 2
+    )
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--titles', type=int, default=500)
+    parser.add_argument('--reviews', type=int, default=5000)
+    parser.add_argument('--comments-per-review', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--page-sizes', type=int, nargs='+', default=[10, 50, 100],
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=200,
+        help='Timed calls per page size and class',
+    )
+    parser.add_argument('--output', help='Write the results to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(os.path.join(directory, 'benchmark.sqlite3'))
+        from api import renderers
+
+        if renderers.orjson is None:
+            print('orjson is not installed, both classes use stdlib json')
+        build_dataset(options)
+        for name, queryset, serializer_class, rows_class in resources():
+            if name not in PAGES:
+                continue
+            rows = rows_class(serializer_class.Meta.fields)
+            results[name] = []
+            for page_size in options.page_sizes:
+                # The shape of a paginated list response
+                data = {
+                    'count': queryset.count(),
+                    'next': None,
+                    'previous': None,
+                    'results': rows.to_representation(
+                        rows.values(queryset)[:page_size]
+                    ),
+                }
+                result = {'page_size': page_size}
+                result.update(compare_json(data, options.repeat))
+                results[name].append(result)
+                print(name, json.dumps(result))
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(json.dumps(results, indent=2, sort_keys=True) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
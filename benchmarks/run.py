@@ -0,0 +1,271 @@
+"""
+Endpoint benchmarks of the YaMDb API.
+
+Builds a throwaway SQLite database with a generated dataset, drives the
+real URLconf through the DRF test client and reports latency percentiles,
+throughput and SQL query counts per endpoint. Results can be stored as a
+JSON baseline and later runs fail when they regress beyond a threshold:
+
+    python benchmarks/run.py --update-baseline
+    python benchmarks/run.py --threshold 0.25
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from itertools import count
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANAGE_PATH = os.path.join(BASE_DIR, 'api_yamdb')
+DEFAULT_BASELINE = os.path.join(BASE_DIR, 'benchmarks', 'baseline.json')
+
+# Latency metrics compared with the baseline; p99 of a few hundred
+# requests is too noisy to gate on and is only reported
+LATENCY_METRICS = ('p50_ms', 'p95_ms')
+
+
+def setup_django(database_path):
+    sys.path.insert(0, MANAGE_PATH)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api_yamdb.settings')
+    from django.conf import settings
+
+    settings.DATABASES['default']['NAME'] = database_path
+    settings.EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    import django
+
+    django.setup()
+
+
+def disable_response_cache():
+    from django.conf import settings
+
+    settings.CACHES['benchmark'] = {
+        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+    }
+    settings.RESPONSE_CACHE_ALIAS = 'benchmark'
+
+
+def build_dataset(options):
+    from django.core.management import call_command
+
+    call_command('migrate', verbosity=0)
+    call_command(
+        'generate_dataset',
+        users=options.users,
+        titles=options.titles,
+        reviews=options.reviews,
+        comments_per_review=options.comments_per_review,
+        seed=options.seed,
+        stdout=io.StringIO(),
+    )
+
+
+def authenticated_client(user):
+    from rest_framework.test import APIClient
+    from rest_framework_simplejwt.tokens import AccessToken
+
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}'
+    )
+    return client
+
+
+def scenarios():
+    """
+    Return (name, request factory) pairs. A factory is called once per
+    iteration and returns a callable issuing exactly one request.
+    """
+    from rest_framework.test import APIClient
+    from reviews.models import Genre, Review, Title, User
+
+    anonymous = APIClient()
+    user_client = authenticated_client(
+        User.objects.filter(role=User.ROLE_USER).first()
+    )
+    genre = Genre.objects.order_by('pk').first()
+    title_ids = list(
+        Title.objects.order_by('pk').values_list('pk', flat=True)[:200]
+    )
+    popular = Title.objects.order_by('-review_count', 'pk').first()
+    review_ids = list(
+        Review.objects.filter(title=popular).values_list('pk', flat=True)
+    )
+    sequence = count()
+
+    def titles_list():
+        return lambda: anonymous.get(
+            '/api/v1/titles/', {'genre': genre.slug, 'limit': 50}
+        )
+
+    def title_detail():
+        title_id = title_ids[next(sequence) % len(title_ids)]
+        return lambda: anonymous.get(f'/api/v1/titles/{title_id}/')
+
+    def reviews_list():
+        return lambda: anonymous.get(f'/api/v1/titles/{popular.pk}/reviews/')
+
+    def comment_create():
+        review_id = review_ids[next(sequence) % len(review_ids)]
+        return lambda: user_client.post(
+            f'/api/v1/titles/{popular.pk}/reviews/{review_id}/comments/',
+            {'text': 'Benchmark comment'}
+        )
+
+    def auth_signup():
+        number = next(sequence)
+        return lambda: anonymous.post('/api/v1/auth/signup/', {
+            'username': f'bench{number}',
+            'email': f'bench{number}@yamdb.fake',
+        })
+
+    def auth_token():
+        number = next(sequence)
+        anonymous.post('/api/v1/auth/signup/', {
+            'username': f'token{number}',
+            'email': f'token{number}@yamdb.fake',
+        })
+        code = User.objects.get(username=f'token{number}').confirmation_code
+        return lambda: anonymous.post('/api/v1/auth/token/', {
+            'username': f'token{number}', 'confirmation_code': code,
+        })
+
+    return (
+        ('titles-list', titles_list),
+        ('titles-detail', title_detail),
+        ('reviews-list', reviews_list),
+        ('comments-create', comment_create),
+        ('auth-signup', auth_signup),
+        ('auth-token', auth_token),
+    )
+
+
+def percentile(quantiles, value):
+    return round(quantiles[value - 1], 3)
+
+
+def run_scenario(factory, requests, warmup):
+    from django.db import connections
+
+    from api.middleware import QueryCounter
+
+    for _ in range(warmup):
+        factory()()
+    timings = []
+    queries = []
+    for _ in range(requests):
+        send = factory()
+        counter = QueryCounter()
+        with connections['default'].execute_wrapper(counter):
+            request_started = time.perf_counter()
+            response = send()
+            timings.append((time.perf_counter() - request_started) * 1000)
+        assert response.status_code < 400, response.content
+        queries.append(counter.queries)
+    # Request setup done by the factories is not part of the throughput
+    elapsed = sum(timings) / 1000
+    quantiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return {
+        'requests': requests,
+        'p50_ms': percentile(quantiles, 50),
+        'p95_ms': percentile(quantiles, 95),
+        'p99_ms': percentile(quantiles, 99),
+        'throughput_rps': round(requests / elapsed, 1),
+        'queries': max(queries),
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Return human readable regressions of `results` against `baseline`.
+    Latencies may grow by `threshold` (a fraction), query counts may not
+    grow at all.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in LATENCY_METRICS:
+            limit = expected[metric] * (1 + threshold)
+            if metrics[metric] > limit:
+                regressions.append(
+                    f'{name}: {metric} {metrics[metric]} > {limit:.3f} '
+                    f'(baseline {expected[metric]})'
+                )
+        if metrics['queries'] > expected['queries']:
+            regressions.append(
+                f'{name}: queries {metrics["queries"]} > '
+                f'{expected["queries"]}'
+            )
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--titles', type=int, default=2000)
+    parser.add_argument('--reviews', type=int, default=20000)
+    parser.add_argument('--comments-per-review', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--requests', type=int, default=200,
+        help='Measured requests per endpoint',
+    )
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument(
+        '--with-cache', action='store_true',
+        help='Keep the response cache enabled',
+    )
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument(
+        '--update-baseline', action='store_true',
+        help='Store the results as the new baseline',
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=0.25,
+        help='Allowed latency growth over the baseline (0.25 is 25%%)',
+    )
+    parser.add_argument('--output', help='Write the results to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(os.path.join(directory, 'benchmark.sqlite3'))
+        if not options.with_cache:
+            disable_response_cache()
+        build_dataset(options)
+        results = {}
+        for name, factory in scenarios():
+            results[name] = run_scenario(
+                factory, options.requests, options.warmup
+            )
+            print(name, json.dumps(results[name]))
+    report = json.dumps(results, indent=2, sort_keys=True)
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(report + '\n')
+    if options.update_baseline:
+        with open(options.baseline, 'w') as file:
+            file.write(report + '\n')
+        print(f'Baseline written to {options.baseline}')
+        return 0
+    if not os.path.exists(options.baseline):
+        print(f'No baseline at {options.baseline}, nothing to compare')
+        return 0
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+    regressions = compare(results, baseline, options.threshold)
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
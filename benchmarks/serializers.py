@@ -0,0 +1,144 @@
+"""
+Micro-benchmark of the list serialization paths.
+
+Renders pages of titles, reviews and comments with the model serializers
+of api.serializer and with the row serializers of api.rows, checks that
+both give the same JSON and reports the median time per page and the
+speedup for every page size:
+
+    python benchmarks/serializers.py --page-sizes 10 50 100
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+if __package__ in (None, ''):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)
+    )))
+
+from benchmarks.run import build_dataset, setup_django  # noqa: E402
+
+
+def resources():
+    """
+    Return (name, queryset, serializer class, row serializer class)
+    tuples. The querysets load related rows like the list views do.
+    """
+    from api.rows import CommentRows, ReviewRows, TitleRows
+    from api.serializer import (CommentSerializer, ReviewSerializer,
+                                TitleSerializer)
+    from reviews.models import Comment, Review, Title
+
+    popular = Title.objects.order_by('-review_count', 'pk').first()
+    review = Review.objects.order_by('-comment_count', 'pk').first()
+    return (
+        (
+            'titles',
+            Title.objects.select_related('category')
+            .prefetch_related('genre').order_by('pk'),
+            TitleSerializer, TitleRows,
+        ),
+        (
+            'reviews',
+            Review.objects.filter(title=popular).select_related('author')
+            .order_by('pk'),
+            ReviewSerializer, ReviewRows,
+        ),
+        (
+            'comments',
+            Comment.objects.filter(review=review).select_related('author')
+            .order_by('pk'),
+            CommentSerializer, CommentRows,
+        ),
+    )
+
+
+def measure(render, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        render()
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(timings), 3)
+
+
+def compare_paths(queryset, serializer_class, rows_class, page_size,
+                  repeat):
+    """
+    Time one page of `queryset` on both paths, query included, and
+    return the medians in milliseconds.
+    """
+    from rest_framework.renderers import JSONRenderer
+
+    def serializer_page():
+        return serializer_class(
+            list(queryset[:page_size]), many=True, context={'request': None}
+        ).data
+
+    rows = rows_class(serializer_class.Meta.fields)
+
+    def rows_page():
+        return rows.to_representation(rows.values(queryset)[:page_size])
+
+    renderer = JSONRenderer()
+    assert renderer.render(serializer_page()) == renderer.render(
+        rows_page()
+    ), f'{rows_class.__name__} output differs from the serializer'
+    serializer_ms = measure(serializer_page, repeat)
+    rows_ms = measure(rows_page, repeat)
+    return {
+        'page_size': page_size,
+        'rows': len(queryset[:page_size]),
+        'serializer_ms': serializer_ms,
+        'rows_ms': rows_ms,
+        'speedup': round(serializer_ms / rows_ms, 2),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--titles', type=int, default=500)
+    parser.add_argument('--reviews', type=int, default=5000)
+    parser.add_argument('--comments-per-review', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--page-sizes', type=int, nargs='+', default=[10, 50, 100],
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=50,
+        help='Timed renders per page size and path',
+    )
+    parser.add_argument('--output', help='Write the results to this file')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    options = parse_args(argv)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        setup_django(os.path.join(directory, 'benchmark.sqlite3'))
+        build_dataset(options)
+        for name, queryset, serializer_class, rows_class in resources():
+            results[name] = [
+                compare_paths(
+                    queryset, serializer_class, rows_class, page_size,
+                    options.repeat,
+                )
+                for page_size in options.page_sizes
+            ]
+            for result in results[name]:
+                print(name, json.dumps(result))
+    if options.output:
+        with open(options.output, 'w') as file:
+            file.write(json.dumps(results, indent=2, sort_keys=True) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -30,6 +30,14 @@ if FILENAME not in project_dir_content:
 
 assert get_version() < '4.0.0', 'Пожалуйста, используйте версию Django < 4.0.0'
 
+# The read replica tests route reads to an alias mirroring the test database
+from django.conf import settings  # noqa: E402
+
+settings.DATABASES.setdefault('replica', {
+    **settings.DATABASES['default'], 'TEST': {'MIRROR': 'default'},
+})
+
 pytest_plugins = [
     'tests.fixtures.fixture_user',
+    'tests.fixtures.fixture_cache',
 ]
@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # The test database is flushed between tests, cached responses are not
+    from django.core.cache import caches
+
+    from api.catalog import clear_catalogs
+
+    for cache in caches.all():
+        cache.clear()
+    clear_catalogs()
+    yield
@@ -0,0 +1,69 @@
+from http import HTTPStatus
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08TitleRating:
+
+    def get_rating(self, client, title_id):
+        response = client.get(f'/api/v1/titles/{title_id}/')
+        assert response.status_code == HTTPStatus.OK
+        return response.json()['rating']
+
+    def test_01_rating_follows_reviews(self, client, admin_client,
+                                       user_client, moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        assert self.get_rating(client, title_id) is None, (
+            'Рейтинг произведения без отзывов должен быть равен `None`.'
+        )
+
+        create_single_review(user_client, title_id, 'Хорошо', 6)
+        response = create_single_review(
+            moderator_client, title_id, 'Отлично', 9
+        )
+        assert self.get_rating(client, title_id) == 7, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'создании отзыва.'
+        )
+
+        review_url = (
+            f'/api/v1/titles/{title_id}/reviews/{response.json()["id"]}/'
+        )
+        moderator_client.patch(review_url, data={'score': 10})
+        assert self.get_rating(client, title_id) == 8, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'изменении оценки в отзыве.'
+        )
+
+        moderator_client.delete(review_url)
+        assert self.get_rating(client, title_id) == 6, (
+            'Проверьте, что рейтинг произведения пересчитывается при '
+            'удалении отзыва.'
+        )
+        assert self.get_rating(client, titles[1]['id']) is None, (
+            'Отзывы одного произведения не должны влиять на рейтинг '
+            'другого.'
+        )
+
+    def test_02_rebuild_ratings_command(self, client, admin_client,
+                                        user_client):
+        from reviews.models import Title
+
+        titles, _, _ = create_titles(admin_client)
+        title_id = titles[0]['id']
+        create_single_review(user_client, title_id, 'Неплохо', 5)
+        Title.objects.update(score_sum=0, review_count=0, rating=None)
+
+        call_command('rebuild_ratings')
+        title = Title.objects.get(pk=title_id)
+        assert (title.score_sum, title.review_count, title.rating) == (
+            5, 1, 5
+        ), (
+            'Команда `rebuild_ratings` должна пересчитывать рейтинг '
+            'произведений по их отзывам.'
+        )
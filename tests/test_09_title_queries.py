@@ -0,0 +1,38 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_many_titles, create_titles
+
+# COUNT(*) for the paginator, titles joined with categories, genres
+TITLE_LIST_QUERIES = 3
+# Title joined with its category, genres
+TITLE_DETAIL_QUERIES = 2
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09TitleQueries:
+
+    @pytest.mark.parametrize('limit', (1, 5, 100))
+    def test_01_title_list_query_count(self, client, admin_client,
+                                       django_assert_num_queries, limit):
+        create_many_titles(admin_client, 10)
+        url = f'/api/v1/titles/?limit={limit}'
+        with django_assert_num_queries(TITLE_LIST_QUERIES):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['results'], (
+            f'Проверьте, что GET-запрос к `{url}` возвращает произведения.'
+        )
+
+    def test_02_title_detail_query_count(self, client, admin_client,
+                                         django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        with django_assert_num_queries(TITLE_DETAIL_QUERIES):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()['genre']) == 2, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает жанры '
+            'произведения.'
+        )
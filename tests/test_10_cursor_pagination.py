@@ -0,0 +1,90 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews, create_titles
+
+
+def collect_cursor_pages(client, url):
+    ids = []
+    pages = 0
+    while url:
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        data = response.json()
+        for key in ('next', 'previous', 'results'):
+            assert key in data, (
+                f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+                f'ключ `{key}`.'
+            )
+        ids.extend(obj['id'] for obj in data['results'])
+        url = data['next']
+        pages += 1
+    return ids, pages
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10CursorPagination:
+
+    def test_01_titles_cursor(self, client, admin_client,
+                              django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        ids, pages = collect_cursor_pages(
+            client, '/api/v1/titles/?cursor=&limit=1'
+        )
+        assert ids == sorted(title['id'] for title in titles), (
+            'Проверьте, что курсорная пагинация `/api/v1/titles/` '
+            'возвращает все произведения в порядке `id`.'
+        )
+        assert pages == len(titles)
+
+        with django_assert_num_queries(2) as context:
+            client.get('/api/v1/titles/?cursor=')
+        assert not any(
+            'COUNT(' in query['sql'] for query in context.captured_queries
+        ), 'Курсорная пагинация не должна выполнять `COUNT(*)`.'
+
+    def test_02_reviews_and_comments_cursor(self, client, admin_client, admin,
+                                            user_client, user,
+                                            moderator_client, moderator):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        reviews, titles = create_reviews(admin_client, author_map)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/?cursor='
+        ids, _ = collect_cursor_pages(client, url)
+        assert ids == sorted(
+            (review['id'] for review in reviews), reverse=True
+        ), (
+            'Проверьте, что курсорная пагинация отзывов возвращает все '
+            'отзывы произведения, начиная с новых.'
+        )
+        page = client.get(f'/api/v1/titles/{titles[0]["id"]}/reviews/')
+        assert [review['id'] for review in page.json()['results']] == ids, (
+            'Курсорные и обычные страницы отзывов должны идти в одном '
+            'порядке.'
+        )
+
+        url = (
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+            f'{reviews[0]["id"]}/comments/?cursor='
+        )
+        ids, _ = collect_cursor_pages(client, url)
+        assert ids == [], (
+            'Проверьте, что курсорная пагинация комментариев работает для '
+            'отзыва без комментариев.'
+        )
+
+    def test_03_default_pagination_unchanged(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get('/api/v1/titles/?limit=1')
+        data = response.json()
+        assert data['count'] == len(titles), (
+            'Без параметра `cursor` эндпоинт `/api/v1/titles/` должен '
+            'использовать прежнюю пагинацию с ключом `count`.'
+        )
@@ -0,0 +1,65 @@
+import os
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.conftest import MANAGE_PATH
+
+DATA_DIR = os.path.join(MANAGE_PATH, 'static', 'data')
+
+
+def count_rows(filename):
+    from csv import DictReader
+
+    with open(os.path.join(DATA_DIR, filename), encoding='utf-8') as file:
+        return sum(1 for _ in DictReader(file))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11ConvertCsv:
+
+    def test_01_import_and_skip_existing(self):
+        from reviews.models import Review, Title
+
+        call_command(
+            'convert_csv', data_dir=DATA_DIR, batch_size=7, stdout=StringIO()
+        )
+        assert Title.objects.count() == count_rows('titles.csv'), (
+            'Команда `convert_csv` должна загрузить все произведения.'
+        )
+        assert Review.objects.count() == count_rows('review.csv'), (
+            'Команда `convert_csv` должна загрузить все отзывы.'
+        )
+        assert Title.genre.through.objects.count() == count_rows(
+            'genre_title.csv'
+        ), 'Команда `convert_csv` должна загрузить жанры произведений.'
+
+        title = Title.objects.filter(reviews__isnull=False).first()
+        scores = list(title.reviews.values_list('score', flat=True))
+        assert title.rating == sum(scores) // len(scores), (
+            'После загрузки отзывов командой `convert_csv` рейтинг '
+            'произведений должен быть пересчитан.'
+        )
+
+        call_command('convert_csv', data_dir=DATA_DIR, stdout=StringIO())
+        assert Review.objects.count() == count_rows('review.csv'), (
+            'Повторный запуск `convert_csv` не должен дублировать записи.'
+        )
+
+    def test_02_upsert_mode(self):
+        from reviews.models import Category
+
+        call_command('convert_csv', data_dir=DATA_DIR, stdout=StringIO())
+        category = Category.objects.first()
+        original_name = category.name
+        Category.objects.filter(pk=category.pk).update(name='changed')
+
+        call_command(
+            'convert_csv', data_dir=DATA_DIR, mode='upsert', stdout=StringIO()
+        )
+        category.refresh_from_db()
+        assert category.name == original_name, (
+            'В режиме `upsert` команда `convert_csv` должна перезаписывать '
+            'существующие записи.'
+        )
@@ -0,0 +1,90 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12ResponseCache:
+
+    def test_01_repeated_get_is_served_from_cache(
+            self, client, admin_client, django_assert_num_queries):
+        create_titles(admin_client)
+        url = '/api/v1/titles/?year=1984&limit=5'
+        first = client.get(url)
+        assert first['X-Cache'] == 'MISS'
+        with django_assert_num_queries(0):
+            second = client.get('/api/v1/titles/?limit=5&year=1984')
+        assert second['X-Cache'] == 'HIT', (
+            'Повторный GET-запрос к `/api/v1/titles/` с теми же '
+            'параметрами в другом порядке должен обслуживаться из кеша.'
+        )
+        assert second.json() == first.json()
+
+    def test_02_writes_invalidate_cache(self, client, admin_client,
+                                        user_client):
+        titles, categories, genres = create_titles(admin_client)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        client.get(title_url)
+        client.get('/api/v1/genres/')
+
+        create_single_review(user_client, titles[0]['id'], 'Супер', 10)
+        response = client.get(title_url)
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['rating'] == 10, (
+            'Новый отзыв должен сбрасывать кеш произведений.'
+        )
+
+        admin_client.delete(f'/api/v1/genres/{genres[0]["slug"]}/')
+        response = client.get('/api/v1/genres/')
+        assert len(response.json()['results']) == len(genres) - 1, (
+            'Удаление жанра должно сбрасывать кеш списка жанров.'
+        )
+        response = client.get(title_url)
+        assert genres[0]['slug'] not in [
+            genre['slug'] for genre in response.json()['genre']
+        ], 'Удаление жанра должно сбрасывать кеш произведений.'
+
+    def test_03_cache_stats(self, client, admin_client, user_client):
+        client.get('/api/v1/categories/')
+        client.get('/api/v1/categories/')
+        response = user_client.get('/api/v1/cache/stats/')
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Статистика кеша должна быть доступна только администратору.'
+        )
+        response = admin_client.get('/api/v1/cache/stats/')
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()['categories']['hits'] >= 1
+
+    def test_04_cache_key_includes_host(self, client, admin_client):
+        create_titles(admin_client)
+        url = '/api/v1/titles/?limit=1'
+        first = client.get(url, HTTP_HOST='one.example.com')
+        second = client.get(url, HTTP_HOST='two.example.com')
+        assert second['X-Cache'] == 'MISS', (
+            'Ответы для разных хостов должны кешироваться отдельно.'
+        )
+        assert first.json()['next'].startswith('http://one.example.com/')
+        assert second.json()['next'].startswith('http://two.example.com/'), (
+            'Ссылки `next` закешированного ответа должны указывать на хост '
+            'запроса.'
+        )
+
+    def test_05_process_local_cache_fails_check(self, settings, tmp_path):
+        from api.checks import check_shared_cache
+
+        settings.DEBUG = True
+        assert check_shared_cache(None) == []
+        settings.DEBUG = False
+        assert [error.id for error in check_shared_cache(None)] == [
+            'api.E001'
+        ], 'Кеш одного процесса без DEBUG должен не проходить проверку.'
+        settings.CACHES = {
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.'
+                           'FileBasedCache',
+                'LOCATION': str(tmp_path),
+            }
+        }
+        assert check_shared_cache(None) == []
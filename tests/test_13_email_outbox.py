@@ -0,0 +1,95 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core import mail
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13EmailOutbox:
+    url_signup = '/api/v1/auth/signup/'
+
+    def test_01_signup_enqueues_email(self, client):
+        from reviews.models import QueuedEmail
+
+        valid_data = {'email': 'queued@yamdb.fake', 'username': 'queued'}
+        client.post(self.url_signup, data=valid_data)
+        assert len(mail.outbox) == 0, (
+            f'POST-запрос к `{self.url_signup}` не должен отправлять письмо '
+            'синхронно, письмо должно попасть в очередь.'
+        )
+        email = QueuedEmail.objects.get(recipient=valid_data['email'])
+
+        call_command('send_queued_mail', stdout=StringIO())
+        assert len(mail.outbox) == 1, (
+            'Команда `send_queued_mail` должна отправить письмо из очереди.'
+        )
+        email.refresh_from_db()
+        assert email.sent_at is not None, (
+            'Отправленное письмо должно быть помечено в очереди.'
+        )
+        assert email.message == '', (
+            'Отправленное письмо не должно хранить код подтверждения.'
+        )
+
+        call_command('send_queued_mail', stdout=StringIO())
+        assert len(mail.outbox) == 1, (
+            'Повторный запуск `send_queued_mail` не должен отправлять '
+            'письма повторно.'
+        )
+
+    def test_02_failed_email_is_retried_later(self, client, settings):
+        from reviews.models import QueuedEmail
+
+        settings.EMAIL_BACKEND = 'tests.test_13_email_outbox.FailingBackend'
+        client.post(
+            self.url_signup,
+            data={'email': 'retry@yamdb.fake', 'username': 'retry'}
+        )
+        call_command('send_queued_mail', stdout=StringIO())
+        email = QueuedEmail.objects.get(recipient='retry@yamdb.fake')
+        assert email.sent_at is None
+        assert email.attempts == 1, (
+            'Неудачная отправка должна увеличивать счетчик попыток.'
+        )
+        assert email.send_after > email.created, (
+            'Повторная отправка письма должна быть отложена.'
+        )
+        assert 'SMTP is down' in email.last_error
+
+    def test_03_claimed_emails_are_sent_once(self, client):
+        from django.utils import timezone
+
+        from reviews.outbox import claim_emails
+
+        recipients = {'first@yamdb.fake', 'second@yamdb.fake'}
+        for recipient in recipients:
+            client.post(self.url_signup, data={
+                'email': recipient, 'username': recipient.split('@')[0]
+            })
+        claimed = claim_emails(1)
+        assert len(claimed) == 1
+        # Another worker polls the outbox meanwhile
+        call_command('send_queued_mail', stdout=StringIO())
+        assert [message.to for message in mail.outbox] == [
+            list(recipients - {claimed[0].recipient})
+        ], 'Письмо, взятое другим обработчиком, не должно отправляться.'
+        assert claim_emails(10) == []
+        later = timezone.now() + timedelta(hours=1)
+        assert claim_emails(10, later) == claimed, (
+            'Письма упавшего обработчика должны отправляться после '
+            'окончания аренды.'
+        )
+
+
+class FailingBackend:
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def open(self):
+        raise ConnectionError('SMTP is down')
+
+    def close(self):
+        pass
@@ -0,0 +1,40 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14RequestMetrics:
+
+    def test_01_server_timing_header(self, client):
+        response = client.get('/api/v1/titles/')
+        assert 'Server-Timing' in response, (
+            'Ответ API должен содержать заголовок `Server-Timing`.'
+        )
+        assert response['Server-Timing'].startswith('db;dur=')
+
+    def test_02_metrics_per_url_name(self, client, admin_client,
+                                     user_client):
+        from api.metrics import reset_metrics
+
+        titles, _, _ = create_titles(admin_client)
+        reset_metrics()
+        client.get('/api/v1/titles/')
+        client.get('/api/v1/titles/')
+        client.get(f'/api/v1/titles/{titles[0]["id"]}/')
+
+        response = user_client.get('/api/v1/metrics/')
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            'Метрики должны быть доступны только администратору.'
+        )
+        data = admin_client.get('/api/v1/metrics/').json()
+        assert data['titles-list']['requests'] == 2, (
+            'Метрики должны группироваться по имени URL.'
+        )
+        assert data['titles-detail']['requests'] == 1
+        assert data['titles-list']['queries'] > 0, (
+            'Метрики должны учитывать количество SQL-запросов.'
+        )
+        assert sum(data['titles-list']['total_ms_histogram'].values()) == 2
@@ -0,0 +1,70 @@
+import filecmp
+import os
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+DATASET = {
+    'users': 20,
+    'titles': 30,
+    'reviews': 200,
+    'comments_per_review': 0.5,
+    'seed': 7,
+}
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15GenerateDataset:
+
+    def test_01_generate_into_database(self):
+        from reviews.models import Review, Title, User
+
+        call_command('generate_dataset', stdout=StringIO(), **DATASET)
+        assert User.objects.count() == DATASET['users']
+        assert Title.objects.count() == DATASET['titles']
+        assert Review.objects.count() == DATASET['reviews'], (
+            'Команда `generate_dataset` должна создавать заданное '
+            'количество отзывов.'
+        )
+        counts = sorted(
+            Title.objects.values_list('review_count', flat=True),
+            reverse=True
+        )
+        assert counts[0] > counts[len(counts) // 2], (
+            'Отзывы должны распределяться по произведениям неравномерно.'
+        )
+        assert not Title.objects.filter(
+            review_count__gt=0, rating__isnull=True
+        ).exists(), (
+            'После генерации данных рейтинг произведений должен быть '
+            'пересчитан.'
+        )
+
+    def test_02_csv_output_is_deterministic_and_importable(self, tmp_path):
+        from reviews.models import Comment, Review
+
+        first, second = tmp_path / 'first', tmp_path / 'second'
+        call_command(
+            'generate_dataset', csv_dir=str(first), stdout=StringIO(),
+            **DATASET
+        )
+        call_command(
+            'generate_dataset', csv_dir=str(second), stdout=StringIO(),
+            **DATASET
+        )
+        files = sorted(os.listdir(first))
+        _, mismatch, errors = filecmp.cmpfiles(
+            first, second, files, shallow=False
+        )
+        assert not mismatch and not errors, (
+            'Команда `generate_dataset` с одинаковым `seed` должна '
+            'генерировать одинаковые данные.'
+        )
+
+        call_command('convert_csv', data_dir=str(first), stdout=StringIO())
+        assert Review.objects.count() == DATASET['reviews'], (
+            'Файлы `generate_dataset` должны загружаться командой '
+            '`convert_csv`.'
+        )
+        assert Comment.objects.exists()
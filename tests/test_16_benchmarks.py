@@ -0,0 +1,34 @@
+from benchmarks.run import compare
+
+BASELINE = {
+    'titles-list': {
+        'p50_ms': 10.0, 'p95_ms': 20.0, 'p99_ms': 30.0, 'queries': 3
+    },
+}
+
+
+def test_compare_accepts_results_within_threshold():
+    results = {
+        'titles-list': {
+            'p50_ms': 12.0, 'p95_ms': 24.0, 'p99_ms': 90.0, 'queries': 3
+        },
+        'new-endpoint': {
+            'p50_ms': 1.0, 'p95_ms': 1.0, 'p99_ms': 1.0, 'queries': 1
+        },
+    }
+    assert compare(results, BASELINE, 0.25) == [], (
+        'Результаты в пределах порога не должны считаться регрессией.'
+    )
+
+
+def test_compare_reports_latency_and_query_regressions():
+    results = {
+        'titles-list': {
+            'p50_ms': 13.0, 'p95_ms': 20.0, 'p99_ms': 30.0, 'queries': 4
+        },
+    }
+    regressions = compare(results, BASELINE, 0.25)
+    assert len(regressions) == 2, (
+        'Рост задержки сверх порога и рост числа запросов к БД должны '
+        'считаться регрессией.'
+    )
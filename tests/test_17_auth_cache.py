@@ -0,0 +1,53 @@
+from http import HTTPStatus
+
+import pytest
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17AuthenticationCache:
+    url_me = '/api/v1/users/me/'
+
+    def test_01_repeated_requests_skip_user_query(
+            self, user_client, django_assert_num_queries):
+        user_client.get(self.url_me)
+        with django_assert_num_queries(0):
+            response = user_client.get(self.url_me)
+        assert response.status_code == HTTPStatus.OK, (
+            'Пользователь из кеша аутентификации должен проходить проверку '
+            'прав доступа.'
+        )
+
+    def test_02_role_change_invalidates_cache(self, user, user_client,
+                                              admin_client):
+        response = user_client.get('/api/v1/users/')
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+        admin_client.patch(
+            f'/api/v1/users/{user.username}/', data={'role': 'admin'}
+        )
+        response = user_client.get('/api/v1/users/')
+        assert response.status_code == HTTPStatus.OK, (
+            'Изменение роли пользователя должно сбрасывать кеш '
+            'аутентификации.'
+        )
+
+    def test_03_ban_and_delete_invalidate_cache(self, user, user_client,
+                                                admin_client):
+        user_client.get(self.url_me)
+        user.is_active = False
+        user.save()
+        response = user_client.get(self.url_me)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Заблокированный пользователь не должен проходить '
+            'аутентификацию из кеша.'
+        )
+
+        user.is_active = True
+        user.save()
+        user_client.get(self.url_me)
+        admin_client.delete(f'/api/v1/users/{user.username}/')
+        response = user_client.get(self.url_me)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            'Удаленный пользователь не должен проходить аутентификацию из '
+            'кеша.'
+        )
@@ -0,0 +1,126 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+def result_ids(response):
+    assert response.status_code == HTTPStatus.OK, (
+        'Проверьте, что поисковый GET-запрос возвращает ответ со '
+        'статусом 200.'
+    )
+    return [obj['id'] for obj in response.json()['results']]
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18Search:
+
+    def test_01_titles_search_is_case_insensitive(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        admin_client.post('/api/v1/titles/', data={
+            'name': 'Побег из Шоушенка',
+            'year': 1994,
+            'genre': [],
+            'category': titles[0]['category'],
+            'description': 'Тюремная драма',
+        })
+        response = client.get('/api/v1/titles/', {'search': 'побег'})
+        names = [obj['name'] for obj in response.json()['results']]
+        assert names == ['Побег из Шоушенка'], (
+            'Проверьте, что поиск `?search=` по произведениям не зависит '
+            'от регистра кириллицы.'
+        )
+        assert result_ids(
+            client.get('/api/v1/titles/', {'search': 'орешек'})
+        ) == [titles[1]['id']], (
+            'Проверьте, что поиск `?search=` находит произведение по '
+            'слову из названия.'
+        )
+        assert result_ids(
+            client.get('/api/v1/titles/', {'search': 'back'})
+        ) == [titles[0]['id']], (
+            'Проверьте, что поиск `?search=` учитывает описание '
+            'произведения.'
+        )
+        assert result_ids(
+            client.get('/api/v1/titles/', {'search': '"*'})
+        ) == [], 'Запрос без слов не должен ничего находить.'
+
+    def test_02_titles_search_combines_with_filters(self, client,
+                                                    admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get('/api/v1/titles/', {
+            'search': 'орешек', 'year': titles[0]['year']
+        })
+        assert result_ids(response) == [], (
+            'Проверьте, что поиск сочетается с фильтрами произведений.'
+        )
+
+    def test_03_reviews_search_ranked(self, client, admin_client, user_client,
+                                      moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        weak = create_single_review(
+            user_client, titles[0]['id'],
+            'Сюжет простой, но финал отличный', 7
+        ).json()
+        strong = create_single_review(
+            moderator_client, titles[1]['id'], 'Финал, финал и ещё раз финал', 9
+        ).json()
+        create_single_review(
+            admin_client, titles[0]['id'], 'Скучно', 2
+        )
+        response = client.get('/api/v1/reviews/search/', {'search': 'ФИНАЛ'})
+        assert result_ids(response) == [strong['id'], weak['id']], (
+            'Проверьте, что `/api/v1/reviews/search/` возвращает найденные '
+            'отзывы по убыванию релевантности.'
+        )
+        found = response.json()['results'][0]
+        assert found['title'] == titles[1]['id'], (
+            'Проверьте, что найденный отзыв содержит `id` произведения.'
+        )
+
+        data = response.json()
+        assert data['count'] == 2 and data['next'] is None, (
+            'Проверьте, что результаты поиска отзывов разбиты на страницы.'
+        )
+
+    def test_04_reviews_search_requires_query(self, client):
+        response = client.get('/api/v1/reviews/search/')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что поиск отзывов без `?search=` возвращает ответ '
+            'со статусом 400.'
+        )
+        response = client.post('/api/v1/reviews/search/', {'search': 'x'})
+        assert response.status_code in (
+            HTTPStatus.UNAUTHORIZED, HTTPStatus.METHOD_NOT_ALLOWED
+        ), 'Поиск отзывов доступен только для чтения.'
+
+    def test_05_index_follows_changes(self, client, admin_client,
+                                      user_client):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Неожиданный финал', 8
+        ).json()
+        review_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+        user_client.patch(review_url, data={'text': 'Предсказуемая концовка'})
+        assert result_ids(client.get(
+            '/api/v1/reviews/search/', {'search': 'финал'}
+        )) == [], 'Проверьте, что индекс обновляется при изменении отзыва.'
+        assert result_ids(client.get(
+            '/api/v1/reviews/search/', {'search': 'концовка'}
+        )) == [review['id']]
+
+        user_client.delete(review_url)
+        assert result_ids(client.get(
+            '/api/v1/reviews/search/', {'search': 'концовка'}
+        )) == [], 'Проверьте, что удалённый отзыв исчезает из поиска.'
+
+        admin_client.patch(
+            f'/api/v1/titles/{titles[0]["id"]}/', data={'name': 'Хищник'}
+        )
+        assert result_ids(client.get(
+            '/api/v1/titles/', {'search': 'хищник'}
+        )) == [titles[0]['id']], (
+            'Проверьте, что индекс обновляется при изменении произведения.'
+        )
@@ -0,0 +1,92 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19SparseFields:
+
+    def test_01_titles_fields(self, client, admin_client,
+                              django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        url = '/api/v1/titles/?fields=id,name,rating'
+        # COUNT(*) for the paginator and titles, no category or genres
+        with django_assert_num_queries(2) as context:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        for title in response.json()['results']:
+            assert set(title) == {'id', 'name', 'rating'}, (
+                f'Проверьте, что GET-запрос к `{url}` возвращает только '
+                'запрошенные поля.'
+            )
+        sql = context.captured_queries[-1]['sql']
+        assert 'reviews_category' not in sql, (
+            'Если категория не запрошена, произведения не должны '
+            'объединяться с категориями.'
+        )
+        assert 'description' not in sql, (
+            'Если описание не запрошено, оно не должно загружаться.'
+        )
+
+        url = f'/api/v1/titles/{titles[0]["id"]}/?fields=id,category'
+        with django_assert_num_queries(1):
+            response = client.get(url)
+        assert response.json() == {
+            'id': titles[0]['id'],
+            'category': {
+                'name': 'Фильм', 'slug': titles[0]['category']
+            },
+        }, 'Вложенные сериализаторы должны отдаваться целиком.'
+
+    def test_02_titles_omit(self, client, admin_client):
+        create_titles(admin_client)
+        response = client.get('/api/v1/titles/?omit=description,genre')
+        for title in response.json()['results']:
+            assert set(title) == {
+                'id', 'name', 'year', 'rating', 'review_count', 'category'
+            }, (
+                'Проверьте, что параметр `omit` исключает поля из ответа.'
+            )
+        response = client.get('/api/v1/titles/?fields=id,genre&omit=genre')
+        for title in response.json()['results']:
+            assert set(title) == {'id'}
+
+    def test_03_reviews_and_comments_fields(self, client, admin_client,
+                                            user_client, user):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Отлично', 9
+        ).json()
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        response = client.get(url, {'fields': 'id,score'})
+        assert response.json()['results'] == [
+            {'id': review['id'], 'score': 9}
+        ], 'Проверьте, что параметр `fields` работает для отзывов.'
+        response = client.get(
+            f'{url}{review["id"]}/', {'omit': 'text,pub_date'}
+        )
+        assert response.json() == {
+            'id': review['id'], 'author': user.username, 'score': 9,
+            'comment_count': 0,
+        }
+
+        url = f'{url}{review["id"]}/comments/'
+        user_client.post(url, data={'text': 'Согласен'})
+        response = client.get(url, {'fields': 'text'})
+        assert response.json()['results'] == [{'text': 'Согласен'}], (
+            'Проверьте, что параметр `fields` работает для комментариев.'
+        )
+
+    def test_04_writes_ignore_fields(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/categories/?fields=slug',
+            data={'name': 'Игры', 'slug': 'games'}
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Параметр `fields` не должен влиять на запросы на запись.'
+        )
+        assert response.json() == {'name': 'Игры', 'slug': 'games'}
+        response = admin_client.get('/api/v1/categories/?fields=slug')
+        assert response.json()['results'] == [{'slug': 'games'}]
@@ -0,0 +1,175 @@
+import time
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+def get_validated(client, url):
+    response = client.get(url)
+    assert response.status_code == HTTPStatus.OK
+    for header in ('ETag', 'Last-Modified'):
+        assert response.has_header(header), (
+            f'Проверьте, что ответ на GET-запрос к `{url}` содержит '
+            f'заголовок `{header}`.'
+        )
+    return response
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20ConditionalGet:
+
+    def test_01_titles_not_modified(self, client, admin_client,
+                                    django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        for url in ('/api/v1/titles/', f'/api/v1/titles/{titles[0]["id"]}/'):
+            etag = get_validated(client, url)['ETag']
+            with django_assert_num_queries(0):
+                response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                f'Проверьте, что GET-запрос к `{url}` с совпадающим '
+                '`If-None-Match` возвращает ответ со статусом 304.'
+            )
+            assert not response.content
+
+        etag = client.get('/api/v1/titles/')['ETag']
+        assert client.get('/api/v1/titles/?limit=1')['ETag'] != etag, (
+            'ETag должен зависеть от параметров запроса.'
+        )
+        admin_client.patch(
+            f'/api/v1/titles/{titles[0]["id"]}/', data={'year': 1985}
+        )
+        response = client.get('/api/v1/titles/', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что после изменения произведения старый ETag '
+            'больше не совпадает.'
+        )
+
+    def test_02_reviews_and_comments_not_modified(
+            self, client, admin_client, user_client, moderator_client,
+            django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        comments_url = f'{reviews_url}{review["id"]}/comments/'
+        reviews_etag = get_validated(client, reviews_url)['ETag']
+        comments_etag = get_validated(client, comments_url)['ETag']
+        for url, etag in ((reviews_url, reviews_etag),
+                          (comments_url, comments_etag)):
+            with django_assert_num_queries(0):
+                response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+                f'Проверьте, что GET-запрос к `{url}` с совпадающим '
+                '`If-None-Match` возвращает 304 без запросов к базе.'
+            )
+        other_url = f'/api/v1/titles/{titles[1]["id"]}/reviews/'
+        other_etag = get_validated(client, other_url)['ETag']
+
+        moderator_client.post(comments_url, data={'text': 'Согласен'})
+        assert client.get(
+            reviews_url, HTTP_IF_NONE_MATCH=reviews_etag
+        ).status_code == HTTPStatus.OK, (
+            'Новый комментарий меняет число комментариев отзыва и должен '
+            'менять ETag списка отзывов.'
+        )
+        assert client.get(
+            comments_url, HTTP_IF_NONE_MATCH=comments_etag
+        ).status_code == HTTPStatus.OK, (
+            'Проверьте, что новый комментарий меняет ETag списка '
+            'комментариев.'
+        )
+
+        reviews_etag = get_validated(client, reviews_url)['ETag']
+        create_single_review(moderator_client, titles[0]['id'], 'Ок', 5)
+        assert client.get(
+            reviews_url, HTTP_IF_NONE_MATCH=reviews_etag
+        ).status_code == HTTPStatus.OK, (
+            'Проверьте, что новый отзыв меняет ETag списка отзывов.'
+        )
+        assert client.get(
+            other_url, HTTP_IF_NONE_MATCH=other_etag
+        ).status_code == HTTPStatus.NOT_MODIFIED, (
+            'Отзывы одного произведения не должны менять ETag отзывов '
+            'другого.'
+        )
+
+    def test_03_if_modified_since(self, client, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        last_modified = get_validated(client, url)['Last-Modified']
+        response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == HTTPStatus.NOT_MODIFIED, (
+            'Проверьте, что GET-запрос с `If-Modified-Since` не раньше '
+            '`Last-Modified` возвращает ответ со статусом 304.'
+        )
+
+    def test_04_deleted_review_is_modified(self, client, admin_client,
+                                           user_client):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+        etag = get_validated(client, url)['ETag']
+        user_client.delete(url)
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Удалённый отзыв не должен отдаваться как неизменённый.'
+        )
+
+    def test_05_renamed_author_is_modified(self, client, admin_client,
+                                           user_client, user):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+        user_client.post(f'{url}comments/', data={'text': 'Дополню'})
+        etags = {
+            etag_url: get_validated(client, etag_url)['ETag']
+            for etag_url in (url, f'{url}comments/')
+        }
+        user.username = 'RenamedUser'
+        user.save()
+        for etag_url, etag in etags.items():
+            response = client.get(etag_url, HTTP_IF_NONE_MATCH=etag)
+            assert response.status_code == HTTPStatus.OK, (
+                'Смена имени автора должна менять ETag его отзывов и '
+                'комментариев.'
+            )
+            assert 'RenamedUser' in response.content.decode()
+
+    @pytest.mark.parametrize('command', ['rebuild_ratings',
+                                         'reconcile_counters'])
+    def test_06_repair_commands_are_modified(self, client, admin_client,
+                                             user_client, command):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'Хорошо', 7)
+        urls = (
+            '/api/v1/titles/', f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        )
+        etags = {url: get_validated(client, url)['ETag'] for url in urls}
+        call_command(command, stdout=StringIO())
+        for url, etag in etags.items():
+            assert client.get(
+                url, HTTP_IF_NONE_MATCH=etag
+            ).status_code == HTTPStatus.OK, (
+                f'Команда `{command}` должна менять ETag `{url}`.'
+            )
+
+    def test_07_version_stamps_expire(self, client, admin_client, settings):
+        settings.RESPONSE_VERSION_TIMEOUT = 1
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/'
+        etag = get_validated(client, url)['ETag']
+        time.sleep(1.1)
+        assert client.get(
+            url, HTTP_IF_NONE_MATCH=etag
+        ).status_code == HTTPStatus.OK, (
+            'ETag не должен совпадать дольше RESPONSE_VERSION_TIMEOUT.'
+        )
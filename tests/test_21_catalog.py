@@ -0,0 +1,128 @@
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_categories, create_genre
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21Catalog:
+
+    def test_01_listing_without_queries(self, client, admin_client,
+                                        django_assert_num_queries):
+        categories = create_categories(admin_client)
+        genres = create_genre(admin_client)
+        client.get('/api/v1/categories/')
+        client.get('/api/v1/genres/')
+        for url in ('/api/v1/categories/?search=ФИЛЬМ',
+                    '/api/v1/genres/?limit=2&offset=1'):
+            # A different query string misses the response cache
+            with django_assert_num_queries(0):
+                response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+        assert response.json()['count'] == len(genres)
+        assert response.json()['results'] == [
+            {'name': genre['name'], 'slug': genre['slug']}
+            for genre in genres[1:3]
+        ], 'Проверьте пагинацию жанров из памяти.'
+        response = client.get('/api/v1/categories/?search=фильм')
+        assert response.json()['results'] == [categories[0]], (
+            'Проверьте, что поиск категорий по имени не зависит от регистра.'
+        )
+
+    def test_02_catalog_follows_writes(self, client, admin_client):
+        create_categories(admin_client)
+        client.get('/api/v1/categories/?limit=100')
+        admin_client.delete('/api/v1/categories/films/')
+        admin_client.post(
+            '/api/v1/categories/', data={'name': 'Игры', 'slug': 'games'}
+        )
+        slugs = [
+            category['slug'] for category in
+            client.get('/api/v1/categories/?limit=50').json()['results']
+        ]
+        assert 'films' not in slugs and 'games' in slugs, (
+            'Проверьте, что список категорий обновляется после записи.'
+        )
+
+    def test_03_slug_resolution_without_queries(self, admin_client,
+                                                django_assert_num_queries):
+        create_categories(admin_client)
+        genres = create_genre(admin_client)
+        data = {
+            'name': 'Солярис', 'year': 1972, 'category': 'films',
+            'genre': [genres[0]['slug'], genres[1]['slug']],
+        }
+        admin_client.post('/api/v1/titles/', data=data)
+        from api.serializer import TitleCreateSerializer
+
+        data['name'] = 'Сталкер'
+        serializer = TitleCreateSerializer(data=data)
+        with django_assert_num_queries(0):
+            assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data['category'].slug == 'films'
+
+        response = admin_client.post(
+            '/api/v1/titles/', data={**data, 'category': 'missing'}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Несуществующий slug категории должен приводить к ошибке 400.'
+        )
+        response = admin_client.post(
+            '/api/v1/titles/', data={**data, 'genre': ['missing']}
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_04_slugs_written_past_the_signals(self, client, admin_client):
+        from reviews.models import Category, Genre
+
+        create_categories(admin_client)
+        genres = create_genre(admin_client)
+        client.get('/api/v1/categories/')
+        # Another process or a bulk load: no signal bumps the version
+        Category.objects.bulk_create([Category(name='Игры', slug='games')])
+        response = admin_client.post('/api/v1/titles/', data={
+            'name': 'Doom', 'year': 1993, 'category': 'games',
+            'genre': [genres[0]['slug']],
+        })
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Slug категории, созданной в обход сигналов, должен '
+            'приниматься при создании произведения.'
+        )
+        Genre.objects.bulk_create([Genre(name='Шутер', slug='shooter')])
+        response = admin_client.post('/api/v1/titles/', data={
+            'name': 'Quake', 'year': 1996, 'category': 'games',
+            'genre': ['shooter'],
+        })
+        assert response.status_code == HTTPStatus.CREATED
+        assert response.json()['genre'] == ['shooter']
+
+    def test_05_catalog_expires(self, client, admin_client, settings):
+        from reviews.models import Category
+
+        settings.CATALOG_TTL = 0
+        create_categories(admin_client)
+        client.get('/api/v1/categories/?limit=50')
+        Category.objects.bulk_create([Category(name='Игры', slug='games')])
+        slugs = [
+            category['slug'] for category in
+            client.get('/api/v1/categories/?limit=100').json()['results']
+        ]
+        assert 'games' in slugs, (
+            'Каталог должен перечитываться через CATALOG_TTL секунд.'
+        )
+
+    def test_06_bulk_load_bumps_catalog(self, client):
+        client.get('/api/v1/categories/')
+        client.get('/api/v1/genres/')
+        call_command(
+            'generate_dataset', stdout=StringIO(), users=2, categories=2,
+            genres=3, titles=2, reviews=2,
+        )
+        assert client.get('/api/v1/categories/').json()['count'] == 2
+        assert client.get('/api/v1/genres/').json()['count'] == 3, (
+            'Проверьте, что generate_dataset сбрасывает каталог и кеш '
+            'жанров.'
+        )
@@ -0,0 +1,79 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+def counts(facet):
+    return {
+        entry.get('slug', entry.get('year', entry.get('rating'))):
+        entry['count']
+        for entry in facet
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+class Test22TitleFacets:
+
+    def test_01_facet_counts(self, client, admin_client, user_client,
+                             django_assert_max_num_queries):
+        titles, categories, genres = create_titles(admin_client)
+        create_single_review(user_client, titles[0]['id'], 'Хорошо', 8)
+        url = '/api/v1/titles/facets/'
+        with django_assert_max_num_queries(2):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        data = response.json()
+        assert data['count'] == 2
+        assert counts(data['genre']) == {
+            genres[0]['slug']: 1, genres[1]['slug']: 1,
+            genres[2]['slug']: 1,
+        }, 'Проверьте подсчёт произведений по жанрам.'
+        assert counts(data['category']) == {
+            categories[0]['slug']: 1, categories[1]['slug']: 1,
+        }, 'Проверьте подсчёт произведений по категориям.'
+        assert counts(data['year']) == {1984: 1, 1988: 1}
+        assert data['rating'] == [
+            {'rating': 8, 'count': 1}, {'rating': None, 'count': 1}
+        ], 'Проверьте подсчёт произведений по рейтингу.'
+
+    def test_02_facets_use_filters(self, client, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        response = client.get(
+            '/api/v1/titles/facets/', {'genre': genres[0]['slug']}
+        )
+        data = response.json()
+        assert data['count'] == 1
+        assert counts(data['category']) == {
+            categories[0]['slug']: 1, categories[1]['slug']: 0,
+        }, 'Проверьте, что фасеты учитывают фильтры произведений.'
+        assert counts(data['genre'])[genres[2]['slug']] == 0
+
+        data = client.get(
+            '/api/v1/titles/facets/', {'search': 'орешек'}
+        ).json()
+        assert counts(data['year']) == {1988: 1}, (
+            'Проверьте, что фасеты учитывают полнотекстовый поиск.'
+        )
+
+    def test_03_facets_cached(self, client, admin_client,
+                              django_assert_num_queries):
+        titles, categories, _ = create_titles(admin_client)
+        url = '/api/v1/titles/facets/?year=1984'
+        client.get(url)
+        with django_assert_num_queries(0):
+            response = client.get(url)
+        assert response['X-Cache'] == 'HIT', (
+            'Проверьте, что фасеты кешируются по параметрам фильтров.'
+        )
+        admin_client.patch(
+            f'/api/v1/titles/{titles[1]["id"]}/', data={'year': 1984}
+        )
+        assert client.get(url).json()['count'] == 2, (
+            'Проверьте, что кеш фасетов сбрасывается при изменении '
+            'произведений.'
+        )
@@ -0,0 +1,91 @@
+import json
+import os
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.conftest import MANAGE_PATH
+
+DATA_DIR = os.path.join(MANAGE_PATH, 'static', 'data')
+
+
+def streamed(response):
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming, 'Экспорт должен отдаваться потоком.'
+    return b''.join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23Export:
+
+    def test_01_titles_ndjson(self, client, user_client):
+        from reviews.models import Title
+
+        call_command('convert_csv', data_dir=DATA_DIR, stdout=StringIO())
+        url = '/api/v1/export/titles.ndjson'
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED, (
+            'Экспорт доступен только авторизованным пользователям.'
+        )
+        response = user_client.get(url)
+        assert response['Content-Type'].startswith('application/x-ndjson')
+        records = [json.loads(line) for line in streamed(response).split('\n')
+                   if line]
+        assert len(records) == Title.objects.count()
+        title = Title.objects.filter(reviews__isnull=False).first()
+        record = next(r for r in records if r['id'] == title.pk)
+        assert record['rating'] == title.rating
+        assert record['category'] == title.category.slug
+        assert record['genre'] == sorted(
+            title.genre.values_list('slug', flat=True),
+            key=lambda slug: title.genre.get(slug=slug).pk
+        ), 'Проверьте, что экспорт произведений содержит их жанры.'
+
+    def test_02_reviews_csv_layout(self, user_client):
+        call_command('convert_csv', data_dir=DATA_DIR, stdout=StringIO())
+        content = streamed(user_client.get('/api/v1/export/review.csv'))
+        with open(os.path.join(DATA_DIR, 'review.csv'),
+                  encoding='utf-8') as file:
+            header = file.readline().strip()
+        assert content.split('\r\n')[0] == header, (
+            'Проверьте, что CSV-экспорт отзывов совпадает по колонкам с '
+            '`static/data/review.csv`.'
+        )
+        assert user_client.get(
+            '/api/v1/export/users.csv'
+        ).status_code == HTTPStatus.NOT_FOUND, (
+            'Пользователи не должны экспортироваться через API.'
+        )
+        assert user_client.get(
+            '/api/v1/export/review.xml'
+        ).status_code == HTTPStatus.NOT_FOUND
+
+    def test_03_command_round_trip(self, tmp_path):
+        from reviews.models import Comment, Review, Title
+
+        call_command('convert_csv', data_dir=DATA_DIR, stdout=StringIO())
+        models = (Title, Review, Comment, Title.genre.through)
+
+        def table(model):
+            # convert_csv stamps pub_date with the import time
+            return [
+                {key: value for key, value in row.items()
+                 if key != 'pub_date'}
+                for row in model.objects.order_by('pk').values()
+            ]
+
+        expected = {model: table(model) for model in models}
+        call_command(
+            'export_data', output_dir=str(tmp_path), chunk_size=7,
+            stdout=StringIO()
+        )
+        call_command('flush', interactive=False, verbosity=0)
+        call_command(
+            'convert_csv', data_dir=str(tmp_path), stdout=StringIO()
+        )
+        for model, rows in expected.items():
+            assert table(model) == rows, (
+                f'Проверьте, что `convert_csv` загружает данные '
+                f'`{model._meta.label}`, выгруженные `export_data`.'
+            )
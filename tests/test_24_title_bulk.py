@@ -0,0 +1,112 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_categories, create_genre, create_titles
+
+URL = '/api/v1/titles/bulk/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test24TitleBulk:
+
+    def test_01_bulk_create(self, admin_client, client,
+                            django_assert_max_num_queries):
+        from reviews.models import Title
+
+        categories = create_categories(admin_client)
+        genres = create_genre(admin_client)
+        # Warm the in-memory catalog
+        client.get('/api/v1/genres/')
+        client.get('/api/v1/categories/')
+        items = [
+            {
+                'name': f'Произведение {number}', 'year': 1950 + number,
+                'category': categories[number % 2]['slug'],
+                'genre': [genres[0]['slug'], genres[number % 3]['slug']],
+            }
+            for number in range(50)
+        ]
+        with django_assert_max_num_queries(8):
+            response = admin_client.post(URL, data=items, format='json')
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что POST-запрос администратора к `{URL}` '
+            'возвращает ответ со статусом 200.'
+        )
+        results = response.json()['results']
+        assert [result['status'] for result in results] == [201] * 50
+        assert Title.objects.count() == 50
+        for item, result in zip(items, results):
+            title = Title.objects.get(pk=result['data']['id'])
+            assert title.name == item['name'], (
+                'Результаты должны идти в порядке элементов запроса.'
+            )
+            assert sorted(title.genre.values_list('slug', flat=True)) == (
+                sorted(set(item['genre']))
+            )
+            assert result['data']['genre'] == sorted(
+                set(item['genre']),
+                key=[genre['slug'] for genre in genres].index
+            )
+        assert client.get('/api/v1/titles/').json()['count'] == 50, (
+            'Массовая запись должна сбрасывать кеш списка произведений.'
+        )
+
+    def test_02_bulk_update_and_errors(self, admin_client, client):
+        from reviews.models import Title
+
+        titles, _, genres = create_titles(admin_client)
+        response = admin_client.post(URL, data=[
+            {'id': titles[0]['id'], 'year': 1990},
+            {'id': titles[1]['id'], 'genre': [genres[0]['slug']]},
+            {'name': 'Без категории', 'year': 2000, 'genre': []},
+            {'id': 999999, 'year': 1990},
+            {'name': 'Новое', 'year': 2001, 'category': 'missing',
+             'genre': []},
+            {'name': 'Новое', 'year': 2001,
+             'category': titles[0]['category'], 'genre': []},
+        ], format='json')
+        results = response.json()['results']
+        assert [result['status'] for result in results] == [
+            200, 200, 400, 400, 400, 201
+        ], 'Проверьте статусы отдельных элементов массовой записи.'
+        assert 'category' in results[2]['errors']
+        assert 'id' in results[3]['errors']
+        assert Title.objects.get(pk=titles[0]['id']).year == 1990
+        assert results[1]['data']['genre'] == [genres[0]['slug']]
+        assert list(
+            Title.objects.get(pk=titles[1]['id'])
+            .genre.values_list('slug', flat=True)
+        ) == [genres[0]['slug']]
+        assert results[0]['data']['genre'] == titles[0]['genre'], (
+            'Жанры не изменённого элемента должны сохраняться.'
+        )
+        assert Title.objects.count() == 3
+
+        response = admin_client.post(URL, data=[
+            {'id': [titles[0]['id']], 'year': 1991},
+            {'id': {}, 'year': 1991},
+            {'id': True, 'year': 1991},
+            {'id': 1.5, 'year': 1991},
+            {'id': str(titles[1]['id']), 'year': 1992},
+        ], format='json')
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert [result['status'] for result in results] == [
+            400, 400, 400, 400, 200
+        ], 'Проверьте проверку типа `id` элементов массовой записи.'
+        assert all('id' in result['errors'] for result in results[:4])
+        assert Title.objects.get(pk=titles[0]['id']).year == 1990
+        assert Title.objects.get(pk=titles[1]['id']).year == 1992
+
+    def test_03_bulk_permissions_and_limits(self, user_client, admin_client,
+                                            settings):
+        response = user_client.post(URL, data=[], format='json')
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        response = admin_client.post(URL, data={'name': 'x'}, format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        settings.TITLE_BULK_MAX_ITEMS = 1
+        response = admin_client.post(URL, data=[{}, {}], format='json')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте ограничение на размер массовой записи.'
+        )
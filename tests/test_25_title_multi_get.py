@@ -0,0 +1,84 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_many_titles, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25TitleMultiGet:
+
+    def test_01_order_and_query_count(self, client, admin_client,
+                                      django_assert_num_queries):
+        ids = create_many_titles(admin_client, 30)
+        requested = ids[::-3] + [ids[0]]
+        url = (
+            f'/api/v1/titles/?id__in={",".join(map(str, requested))}'
+            f'&limit={len(requested)}'
+        )
+        # COUNT(*), titles joined with categories, genres
+        with django_assert_num_queries(3):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        results = response.json()['results']
+        assert [title['id'] for title in results] == requested, (
+            'Проверьте, что `?id__in=` возвращает произведения в '
+            'запрошенном порядке.'
+        )
+        assert all(len(title['genre']) == 3 and title['category']
+                   for title in results)
+
+    def test_02_duplicates_and_missing(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        first, second = titles[0]['id'], titles[1]['id']
+        response = client.get(
+            f'/api/v1/titles/?id__in={second},999999,{first},{second}'
+        )
+        assert [title['id'] for title in response.json()['results']] == [
+            second, first
+        ], 'Повторяющиеся и несуществующие id не должны попадать в ответ.'
+
+    def test_03_limits(self, client, settings):
+        settings.TITLE_ID_IN_MAX = 3
+        response = client.get('/api/v1/titles/?id__in=1,2,3,4')
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте ограничение на длину списка `id__in`.'
+        )
+        for value in ('1,x', ',,', '1,,2', '1e30', '1.7',
+                      '99999999999999999999'):
+            for url in ('/api/v1/titles/', '/api/v1/titles/facets/'):
+                response = client.get(f'{url}?id__in={value}')
+                assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                    f'Проверьте, что `?id__in={value}` в `{url}` приводит '
+                    'к ошибке 400.'
+                )
+
+    def test_04_all_ids_on_one_page(self, client, admin_client):
+        ids = create_many_titles(admin_client, 12)
+        requested = ids[::-1]
+        response = client.get(
+            f'/api/v1/titles/?id__in={",".join(map(str, requested))}'
+        )
+        data = response.json()
+        assert [title['id'] for title in data['results']] == requested, (
+            'Без `limit` все запрошенные через `?id__in=` произведения '
+            'должны помещаться на одну страницу.'
+        )
+        assert data['next'] is None
+        response = client.get(
+            f'/api/v1/titles/?id__in={",".join(map(str, requested))}&limit=5'
+        )
+        assert len(response.json()['results']) == 5
+
+    def test_05_order_kept_with_search(self, client, admin_client):
+        ids = create_many_titles(admin_client, 3)
+        requested = [ids[1], ids[2], ids[0]]
+        response = client.get(
+            f'/api/v1/titles/?id__in={",".join(map(str, requested))}'
+            '&search=произведение'
+        )
+        assert [
+            title['id'] for title in response.json()['results']
+        ] == requested, (
+            'Поиск не должен менять порядок произведений из `?id__in=`.'
+        )
@@ -0,0 +1,98 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26Counters:
+
+    def test_01_counts_follow_writes(self, client, admin_client, user_client,
+                                     moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        create_single_review(moderator_client, titles[0]['id'], 'Ок', 5)
+        assert client.get(title_url).json()['review_count'] == 2, (
+            'Проверьте, что `review_count` произведения учитывает новые '
+            'отзывы.'
+        )
+        review_url = f'{title_url}reviews/{review["id"]}/'
+        comment_ids = [
+            moderator_client.post(
+                f'{review_url}comments/', data={'text': f'Комментарий {n}'}
+            ).json()['id']
+            for n in range(3)
+        ]
+        assert client.get(review_url).json()['comment_count'] == 3, (
+            'Проверьте, что `comment_count` отзыва учитывает новые '
+            'комментарии.'
+        )
+        moderator_client.delete(f'{review_url}comments/{comment_ids[0]}/')
+        assert client.get(review_url).json()['comment_count'] == 2, (
+            'Проверьте, что `comment_count` отзыва уменьшается при удалении '
+            'комментария.'
+        )
+        user_client.delete(review_url)
+        assert client.get(title_url).json()['review_count'] == 1, (
+            'Проверьте, что `review_count` уменьшается при удалении отзыва '
+            'вместе с его комментариями.'
+        )
+
+    def test_02_cascade_from_user(self, client, admin_client, user_client,
+                                  moderator_client, moderator):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        create_single_review(moderator_client, titles[0]['id'], 'Ок', 5)
+        review_url = (
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+        )
+        moderator_client.post(f'{review_url}comments/', data={'text': 'Да'})
+        moderator.delete()
+        assert client.get(review_url).json()['comment_count'] == 0
+        assert client.get(
+            f'/api/v1/titles/{titles[0]["id"]}/'
+        ).json()['review_count'] == 1, (
+            'Удаление пользователя должно уменьшать счётчики его отзывов и '
+            'комментариев.'
+        )
+
+    def test_03_reconcile_command(self, client, admin_client, user_client):
+        from reviews.models import Review, Title
+
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            user_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        user_client.post(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/{review["id"]}/'
+            'comments/',
+            data={'text': 'Сам себе'}
+        )
+        Title.objects.update(review_count=5, score_sum=1)
+        Review.objects.update(comment_count=9)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        assert client.get(title_url).json()['review_count'] == 5
+        out = StringIO()
+        call_command('reconcile_counters', chunk_size=1, stdout=out)
+        response = client.get(title_url)
+        assert response['X-Cache'] == 'MISS'
+        assert response.json()['review_count'] == 1, (
+            'Команда `reconcile_counters` должна сбрасывать кеш ответов.'
+        )
+        title = Title.objects.get(pk=titles[0]['id'])
+        assert (title.review_count, title.score_sum, title.rating) == (
+            1, 7, 7
+        ), 'Команда `reconcile_counters` должна чинить счётчики отзывов.'
+        assert Title.objects.get(pk=titles[1]['id']).review_count == 0
+        assert Review.objects.get().comment_count == 1, (
+            'Команда `reconcile_counters` должна чинить счётчики '
+            'комментариев.'
+        )
+        assert 'Repaired 2 Works' in out.getvalue()
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27NestedQueries:
+
+    @pytest.fixture
+    def review(self, admin_client, moderator_client):
+        titles, _, _ = create_titles(admin_client)
+        review = create_single_review(
+            moderator_client, titles[0]['id'], 'Хорошо', 7
+        ).json()
+        review['title_id'] = titles[0]['id']
+        review['other_title_id'] = titles[1]['id']
+        return review
+
+    def test_01_review_queries(self, user_client, review,
+                               django_assert_num_queries):
+        url = f'/api/v1/titles/{review["title_id"]}/reviews/'
+        # Warm the authentication cache
+        user_client.get(url)
+        # Title, COUNT(*), reviews joined with authors
+        with django_assert_num_queries(3):
+            assert user_client.get(url).status_code == HTTPStatus.OK
+        # Review joined with its author, scoped by the title id
+        with django_assert_num_queries(1):
+            user_client.get(f'{url}{review["id"]}/')
+        # Title, then BEGIN, SAVEPOINT, INSERT, rating UPDATE, RELEASE;
+        # no query checks the author for an existing review
+        with django_assert_num_queries(6):
+            response = user_client.post(url, data={'text': 'Ок', 'score': 5})
+        assert response.status_code == HTTPStatus.CREATED
+
+    def test_02_duplicate_review_uses_constraint(self, user_client, review):
+        url = f'/api/v1/titles/{review["title_id"]}/reviews/'
+        user_client.post(url, data={'text': 'Ок', 'score': 5})
+        response = user_client.post(url, data={'text': 'Ещё', 'score': 6})
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Повторный отзыв на то же произведение должен возвращать 400.'
+        )
+        assert user_client.get(url).json()['count'] == 2
+
+    def test_03_comment_queries(self, user_client, review,
+                                django_assert_num_queries):
+        url = (
+            f'/api/v1/titles/{review["title_id"]}/reviews/{review["id"]}/'
+            'comments/'
+        )
+        user_client.get(url)
+        # Review scoped by both ids, COUNT(*); the page query is skipped
+        # because the review has no comments yet
+        with django_assert_num_queries(2):
+            user_client.get(url)
+        # Review, then BEGIN, INSERT, comment count UPDATE
+        with django_assert_num_queries(4):
+            response = user_client.post(url, data={'text': 'Согласен'})
+        assert response.status_code == HTTPStatus.CREATED
+
+    def test_04_parent_scoped_by_both_ids(self, user_client, review):
+        url = (
+            f'/api/v1/titles/{review["other_title_id"]}/reviews/'
+            f'{review["id"]}/'
+        )
+        assert user_client.get(url).status_code == HTTPStatus.NOT_FOUND
+        for method in ('get', 'post'):
+            response = getattr(user_client, method)(
+                f'{url}comments/', data={'text': 'Чужой отзыв'}
+            )
+            assert response.status_code == HTTPStatus.NOT_FOUND, (
+                'Комментарии отзыва не должны быть доступны через другое '
+                'произведение.'
+            )
@@ -0,0 +1,71 @@
+import pytest
+from django.core.cache import caches
+
+from tests.utils import create_comments
+
+
+def render(client, url, settings, fast):
+    settings.FAST_LIST_SERIALIZERS = fast
+    # Cached list responses would hide the other serialization path
+    for cache in caches.all():
+        cache.clear()
+    response = client.get(url)
+    assert response.status_code == 200, response.content
+    return response.content
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28FastLists:
+
+    @pytest.fixture
+    def data(self, admin_client, user_client, moderator_client, user,
+             moderator):
+        comments, reviews, titles = create_comments(
+            admin_client, {user: user_client, moderator: moderator_client}
+        )
+        # A title without category and one without rating
+        admin_client.delete(f'/api/v1/categories/{titles[1]["category"]}/')
+        return titles[0]['id'], reviews[0]['id'], titles[1]['id']
+
+    def test_01_same_json(self, client, settings, data):
+        title_id, review_id, other_id = data
+        reviews = f'/api/v1/titles/{title_id}/reviews/'
+        urls = (
+            '/api/v1/titles/',
+            '/api/v1/titles/?limit=1&offset=1',
+            '/api/v1/titles/?cursor=&limit=1',
+            '/api/v1/titles/?fields=id,genre,category',
+            '/api/v1/titles/?omit=description,rating',
+            '/api/v1/titles/?genre=horror',
+            '/api/v1/titles/?search=орешек',
+            f'/api/v1/titles/?id__in={other_id},{title_id}',
+            reviews,
+            f'{reviews}?cursor=',
+            f'{reviews}?fields=author,pub_date',
+            f'{reviews}{review_id}/comments/',
+            f'{reviews}{review_id}/comments/?cursor=&omit=id',
+            '/api/v1/reviews/search/?search=review',
+        )
+        for url in urls:
+            assert (
+                render(client, url, settings, fast=True)
+                == render(client, url, settings, fast=False)
+            ), (
+                f'Ответ на GET-запрос к `{url}` должен совпадать байт в '
+                'байт с ответом сериализаторов моделей.'
+            )
+
+    def test_02_titles_skip_serializer(self, client, data, monkeypatch,
+                                       django_assert_num_queries):
+        from api.serializer import TitleSerializer
+
+        def fail(*args, **kwargs):
+            raise AssertionError('TitleSerializer used for a list')
+
+        monkeypatch.setattr(TitleSerializer, 'to_representation', fail)
+        # COUNT(*), titles joined with categories, genres of the page
+        with django_assert_num_queries(3):
+            response = client.get('/api/v1/titles/')
+        assert response.json()['count'] == 2, (
+            'Список произведений должен строиться без сериализатора модели.'
+        )
@@ -0,0 +1,105 @@
+import datetime
+import io
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnList
+
+from api import renderers
+from api.renderers import FastJSONParser, FastJSONRenderer
+
+PAYLOADS = (
+    {'id': 1, 'name': 'Терминатор', 'rating': None, 'genre': ['a', 'b']},
+    ReturnList([OrderedDict(slug='x', count=2)], serializer=None),
+    {
+        'utc': datetime.datetime(
+            2023, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc
+        ),
+        'moscow': timezone.make_aware(
+            datetime.datetime(2023, 5, 1, 12, 30),
+            timezone.get_fixed_timezone(180),
+        ),
+        'naive': datetime.datetime(2023, 5, 1, 12, 30, 0, 5),
+        'date': datetime.date(2023, 5, 1),
+        'time': datetime.time(8, 15, 1, 250),
+        'duration': datetime.timedelta(hours=1, microseconds=3),
+    },
+    {
+        'price': Decimal('12.50'), 'small': Decimal('0.001'),
+        'whole': Decimal('3'), 'float': 0.1,
+    },
+    {
+        'lazy': gettext_lazy('This field is required.'),
+        'uuid': uuid.UUID(int=1), 'bytes': b'raw', 'tuple': (1, 2),
+        'separators': 'a b c', 'escapes': '"\\\n\t',
+        1: 'int key',
+    },
+    # Too big for orjson
+    {'big': 2 ** 70},
+    [],
+)
+
+
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_01_renderer_matches_stdlib(payload):
+    expected = JSONRenderer().render(payload)
+    assert FastJSONRenderer().render(payload) == expected, (
+        'Быстрый рендерер должен давать тот же JSON, что и JSONRenderer.'
+    )
+    media_type = 'application/json; indent=4'
+    assert FastJSONRenderer().render(payload, media_type) == (
+        JSONRenderer().render(payload, media_type)
+    )
+
+
+def test_02_renderer_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, 'orjson', None)
+    for payload in PAYLOADS:
+        assert FastJSONRenderer().render(payload) == (
+            JSONRenderer().render(payload)
+        )
+    assert FastJSONRenderer().render(None) == b''
+
+
+def parse(parser, body):
+    return parser.parse(io.BytesIO(body), parser_context={})
+
+
+@pytest.mark.parametrize('fallback', (False, True))
+def test_03_parser_matches_stdlib(monkeypatch, fallback):
+    if fallback:
+        monkeypatch.setattr(renderers, 'orjson', None)
+    body = '{"name": "Ёж", "year": 1984, "score": 7.5, "genre": []}'.encode()
+    assert parse(FastJSONParser(), body) == parse(JSONParser(), body)
+    for body in (b'{"name": ', b'{"score": NaN}', b''):
+        with pytest.raises(ParseError) as fast_error:
+            parse(FastJSONParser(), body)
+        with pytest.raises(ParseError) as error:
+            parse(JSONParser(), body)
+        assert str(fast_error.value) == str(error.value), (
+            'Ошибки разбора JSON должны сообщаться как раньше.'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_04_api_uses_fast_json(admin_client):
+    response = admin_client.post(
+        '/api/v1/categories/', data={'name': 'Игры', 'slug': 'games'},
+        format='json',
+    )
+    assert response.status_code == HTTPStatus.CREATED, (
+        'POST-запрос с телом в формате JSON должен обрабатываться.'
+    )
+    response = admin_client.get('/api/v1/categories/')
+    assert isinstance(
+        response.accepted_renderer, FastJSONRenderer
+    ), 'Ответы API должны отдаваться быстрым JSON-рендерером.'
+    assert response.content == JSONRenderer().render(response.data)
@@ -0,0 +1,46 @@
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+from reviews.sqlite import pragma_statements, read_pragmas
+
+
+def test_01_journal_mode_goes_first():
+    statements = pragma_statements({'synchronous': 'normal',
+                                    'journal_mode': 'wal'})
+    assert statements == [
+        'PRAGMA journal_mode = wal', 'PRAGMA synchronous = normal'
+    ], 'Режим журнала должен включаться до остальных настроек.'
+
+
+@pytest.mark.django_db
+def test_02_connection_is_tuned(tmp_path):
+    values = read_pragmas(
+        connection, ('synchronous', 'cache_size', 'busy_timeout')
+    )
+    # synchronous=NORMAL is reported as 1
+    assert values == {
+        'synchronous': 1,
+        'cache_size': settings.SQLITE_PRAGMAS['cache_size'],
+        'busy_timeout': settings.SQLITE_PRAGMAS['busy_timeout'],
+    }, 'Проверьте, что новые соединения с SQLite получают SQLITE_PRAGMAS.'
+
+    # The test database lives in memory, WAL needs a file
+    file_connection = DatabaseWrapper({
+        **connection.settings_dict, 'NAME': str(tmp_path / 'db.sqlite3')
+    })
+    try:
+        values = read_pragmas(file_connection, ('journal_mode', 'mmap_size'))
+    finally:
+        file_connection.close()
+    assert values == {
+        'journal_mode': 'wal',
+        'mmap_size': settings.SQLITE_PRAGMAS['mmap_size'],
+    }, 'Проверьте, что база данных в файле работает в режиме WAL.'
+
+
+def test_03_connections_are_reused():
+    assert settings.DATABASES['default']['CONN_MAX_AGE'] > 0, (
+        'Соединения с базой данных должны переиспользоваться.'
+    )
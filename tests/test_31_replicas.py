@@ -0,0 +1,102 @@
+import sqlite3
+from http import HTTPStatus
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from api.replicas import ReplicaRouter, stop_using_replicas, use_replicas
+from reviews.models import Title
+from tests.utils import create_single_review, create_titles
+
+DATABASES = ['default', 'replica']
+
+
+@pytest.fixture
+def replicas(settings):
+    settings.DATABASE_REPLICAS = ['replica']
+    settings.DATABASE_REPLICA_LAG = 0
+    return settings
+
+
+def queries(alias):
+    return CaptureQueriesContext(connections[alias])
+
+
+def test_01_router_pins_writes(replicas):
+    router = ReplicaRouter()
+    assert router.db_for_read(Title) is None, (
+        'Вне запроса на чтение выбор базы должен оставаться за Django.'
+    )
+    token = use_replicas()
+    try:
+        assert router.db_for_read(Title) == 'replica'
+        assert router.db_for_write(Title) == 'default'
+        assert router.db_for_read(Title) == 'default', (
+            'После записи запрос должен читать свои изменения из основной '
+            'базы.'
+        )
+    finally:
+        stop_using_replicas(token)
+    assert router.allow_migrate('replica', 'reviews') is False
+
+
+@pytest.mark.django_db(transaction=True, databases=DATABASES)
+class Test31Replicas:
+
+    def test_01_safe_requests_read_replica(self, client, admin_client,
+                                           user_client, replicas):
+        titles, _, _ = create_titles(admin_client)
+        urls = (
+            '/api/v1/titles/',
+            f'/api/v1/titles/{titles[0]["id"]}/',
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+            '/api/v1/titles/facets/',
+        )
+        for url in urls:
+            with queries('default') as primary, queries('replica') as replica:
+                assert client.get(url).status_code == HTTPStatus.OK
+            assert replica.captured_queries and not primary.captured_queries, (
+                f'GET-запрос к `{url}` должен читать данные из реплики.'
+            )
+
+        with queries('replica') as replica:
+            response = create_single_review(
+                user_client, titles[0]['id'], 'Хорошо', 7
+            )
+        assert response.status_code == HTTPStatus.CREATED
+        assert not replica.captured_queries, (
+            'Запросы на запись не должны обращаться к реплике.'
+        )
+
+    def test_02_recent_writes_read_primary(self, client, admin_client,
+                                           replicas):
+        replicas.DATABASE_REPLICA_LAG = 60
+        create_titles(admin_client)
+        with queries('replica') as replica:
+            response = client.get('/api/v1/titles/')
+        assert response.json()['count'] == 2
+        assert not replica.captured_queries, (
+            'Только что изменённые данные должны читаться из основной базы, '
+            'пока реплика может отставать.'
+        )
+
+    def test_03_sync_replicas(self, admin_client, monkeypatch, tmp_path):
+        create_titles(admin_client)
+        path = tmp_path / 'replica.sqlite3'
+        monkeypatch.setitem(connections.settings, 'copy', {
+            **connections['default'].settings_dict, 'NAME': str(path),
+        })
+        call_command('sync_replicas', 'copy', pages=1)
+        with sqlite3.connect(path) as replica:
+            count = replica.execute(
+                'SELECT COUNT(*) FROM reviews_title'
+            ).fetchone()[0]
+        assert count == 2, (
+            'Проверьте, что команда `sync_replicas` копирует основную базу '
+            'в файл реплики.'
+        )
+        # The test replica mirrors the default database
+        with pytest.raises(CommandError):
+            call_command('sync_replicas', 'replica')
@@ -0,0 +1,91 @@
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_comments
+
+# A plan step reading a whole table; FTS5 tables are searched through
+# their own index ("SCAN ... VIRTUAL TABLE INDEX")
+FULL_SCAN = re.compile(r'^SCAN (?!.*(USING|VIRTUAL TABLE))')
+
+
+def query_plans(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200, response.content
+    plans = []
+    with connection.cursor() as cursor:
+        for query in context.captured_queries:
+            cursor.execute(f'EXPLAIN QUERY PLAN {query["sql"]}')
+            plans.append(
+                (query['sql'], [row[3] for row in cursor.fetchall()])
+            )
+    return response, plans
+
+
+@pytest.mark.django_db(transaction=True)
+class Test32ListIndexes:
+
+    def test_01_list_queries_use_indexes(self, client, admin_client, user,
+                                         user_client, moderator,
+                                         moderator_client):
+        _, reviews, titles = create_comments(admin_client, {
+            user: user_client, moderator: moderator_client
+        })
+        title_id, review_id = titles[0]['id'], reviews[0]['id']
+        reviews_url = f'/api/v1/titles/{title_id}/reviews/'
+        comments_url = f'{reviews_url}{review_id}/comments/'
+        first_page, _ = query_plans(client, '/api/v1/titles/?cursor=&limit=1')
+        urls = (
+            '/api/v1/titles/?year=1984',
+            '/api/v1/titles/?name=Терминатор',
+            '/api/v1/titles/?category=films',
+            '/api/v1/titles/?category=films&year=1984',
+            '/api/v1/titles/?genre=horror',
+            '/api/v1/titles/?search=орешек',
+            f'/api/v1/titles/?id__in={title_id}',
+            first_page.json()['next'],
+            '/api/v1/titles/facets/?year=1984',
+            reviews_url,
+            f'{reviews_url}?cursor=',
+            comments_url,
+            f'{comments_url}?cursor=',
+            '/api/v1/reviews/search/?search=review',
+        )
+        for url in urls:
+            _, plans = query_plans(client, url)
+            for sql, plan in plans:
+                scans = [step for step in plan if FULL_SCAN.match(step)]
+                assert not scans, (
+                    f'Запрос GET `{url}` читает таблицу целиком вместо '
+                    f'индекса: {scans}\n{sql}'
+                )
+
+    def test_02_nested_lists_ordered_by_index(self, client, admin_client,
+                                              user, user_client, moderator,
+                                              moderator_client):
+        _, reviews, titles = create_comments(admin_client, {
+            user: user_client, moderator: moderator_client
+        })
+        reviews_url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        for url, index in (
+            (reviews_url, 'review_title_pub_date_idx'),
+            (f'{reviews_url}{reviews[0]["id"]}/comments/',
+             'comment_review_pub_date_idx'),
+        ):
+            response, plans = query_plans(client, url)
+            results = response.json()['results']
+            assert [row['pub_date'] for row in results] == sorted(
+                (row['pub_date'] for row in results), reverse=True
+            ), f'Проверьте, что `{url}` отдаёт новые записи первыми.'
+            page_plans = [
+                plan for sql, plan in plans
+                if 'ORDER BY' in sql and 'COUNT' not in sql
+            ]
+            assert page_plans and all(
+                any(index in step for step in plan)
+                and not any('TEMP B-TREE' in step for step in plan)
+                for plan in page_plans
+            ), f'Страница `{url}` должна читаться по индексу {index}.'
@@ -244,6 +244,23 @@ def create_titles(admin_client):
     return result, categories, genres
 
 
+def create_many_titles(admin_client, amount):
+    # The titles of create_titles() plus `amount` titles with every genre
+    from reviews.models import Category, Genre, Title
+
+    create_titles(admin_client)
+    category = Category.objects.first()
+    genres = list(Genre.objects.all())
+    ids = []
+    for idx in range(amount):
+        title = Title.objects.create(
+            name=f'Произведение {idx}', year=2000, category=category
+        )
+        title.genre.set(genres)
+        ids.append(title.pk)
+    return ids
+
+
 def create_reviews(admin_client, authors_map):
     titles, _, _ = create_titles(admin_client)
     result = []